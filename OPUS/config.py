@@ -4,11 +4,10 @@ Application configuration, constants, and theme definitions.
 Centralizes all magic numbers, strings, and configurable behavior.
 """
 
-import os
 import json
 import logging
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, List
 from pathlib import Path
 
 # ─── Version ───────────────────────────────────────────────
@@ -21,6 +20,9 @@ APP_DIR = Path(__file__).parent.resolve()
 CONFIG_FILE = APP_DIR / "validator_config.json"
 LOG_FILE = APP_DIR / "validator.log"
 RECENT_FILES_PATH = APP_DIR / ".recent_files.json"
+JAR_CACHE_DIR = APP_DIR / ".jar_cache"      # Extracted JAR metadata, keyed by mtime+size
+JAR_CACHE_MAX_FILES = 500                    # Least recently used entries beyond this are removed
+PARALLEL_MIN_JARS = 4                        # Fewer uncached JARs are extracted in-process
 MAX_RECENT_FILES = 20
 
 # ─── Logging ───────────────────────────────────────────────
@@ -32,6 +34,10 @@ LOG_LEVEL = logging.INFO
 MAX_FILE_SIZE_MB = 50
 SUPPORTED_EXTENSIONS = {".xml"}
 ENCODING_FALLBACKS = ["utf-8", "utf-8-sig", "latin-1", "cp1252"]
+PARALLEL_MIN_FILES = 8      # Below this, worker startup costs more than it saves
+PARALLEL_MIN_FILES_SPAWN = 1000  # Same under spawn/forkserver: ~0.5 s to start 4 workers
+WORKER_METADATA_MB = 50     # Larger pickled metadata stays sequential under spawn
+CLI_OUTPUT_BATCH = 100      # Files per buffered stdout write in CLI mode
 
 # TestNG valid attribute values
 VALID_PARALLEL_VALUES = frozenset({"methods", "tests", "classes", "instances", "false", "none"})
@@ -214,9 +220,15 @@ class AppConfig:
 
     def add_recent_file(self, path: str) -> None:
         """Add a file to the recent files list."""
-        path = str(Path(path).resolve())
-        if path in self.recent_files:
-            self.recent_files.remove(path)
-        self.recent_files.insert(0, path)
+        self.add_recent_files([path])
+
+    def add_recent_files(self, paths: List[str]) -> None:
+        """Add files to the recent list (last one first), saving once."""
+        # Earlier paths would be pushed off the end of the list anyway
+        for path in paths[-self.max_recent_files:]:
+            path = str(Path(path).resolve())
+            if path in self.recent_files:
+                self.recent_files.remove(path)
+            self.recent_files.insert(0, path)
         self.recent_files = self.recent_files[:self.max_recent_files]
         self.save()
@@ -1,7 +1,25 @@
 """
 Exporters package - Report generation in various formats.
+
+Each exporter module is imported the first time its function is accessed,
+so a run that writes one format never loads the others.
 """
 
-from .html_exporter import export_html
-from .csv_exporter import export_csv
-from .json_exporter import export_json
+import importlib
+
+_EXPORTER_MODULES = {
+    "export_html": ".html_exporter",
+    "export_csv": ".csv_exporter",
+    "export_json": ".json_exporter",
+}
+
+__all__ = list(_EXPORTER_MODULES)
+
+
+def __getattr__(name):
+    module = _EXPORTER_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    func = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = func
+    return func
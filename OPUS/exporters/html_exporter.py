@@ -82,53 +82,54 @@ def export_html(results: List[ValidationResult], output_path: str, title: str =
         True on success
     """
     try:
-        pass_count = sum(1 for r in results if r.status == "PASS")
-        fail_count = sum(1 for r in results if r.status == "FAIL")
-        warn_count = sum(1 for r in results if r.status == "WARN")
-
-        # Build file rows
-        file_rows = ""
-        for r in results:
-            status_cls = f"status-{r.status.lower()}"
-            file_rows += (
-                f"<tr>"
-                f"<td>{os.path.basename(r.file_path)}</td>"
-                f"<td class='{status_cls}'>{r.status_icon} {r.status}</td>"
-                f"<td>{r.error_count}</td>"
-                f"<td>{r.warning_count}</td>"
-                f"<td>{r.duration_ms:.1f}ms</td>"
-                f"</tr>"
-            )
-
-        # Build error details
-        error_details = ""
-        for r in results:
-            if r.errors:
-                error_details += f'<div class="errors-section"><h3>{os.path.basename(r.file_path)}</h3>'
-                for e in r.errors:
-                    sev_cls = f"severity-{e.severity.value.lower()}"
-                    error_details += (
-                        f'<div class="error-item {sev_cls}">'
-                        f"[{e.code}] Line {e.line or '?'}: {e.message}"
-                        f"</div>"
-                    )
-                error_details += "</div>"
-
-        html = HTML_TEMPLATE.format(
+        fields = dict(
             title=title,
             timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             app_name=APP_NAME,
             app_version=APP_VERSION,
             total_files=len(results),
-            pass_count=pass_count,
-            fail_count=fail_count,
-            warn_count=warn_count,
-            file_rows=file_rows,
-            error_details=error_details,
+            pass_count=sum(1 for r in results if r.status == "PASS"),
+            fail_count=sum(1 for r in results if r.status == "FAIL"),
+            warn_count=sum(1 for r in results if r.status == "WARN"),
         )
+        # The report is written a file at a time around the two variable
+        # sections, so the whole document is never held as one string
+        head, rest = HTML_TEMPLATE.split("{file_rows}")
+        middle, foot = rest.split("{error_details}")
 
         with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html)
+            f.write(head.format(**fields))
+
+            # File rows
+            for r in results:
+                status_cls = f"status-{r.status.lower()}"
+                f.write(
+                    f"<tr>"
+                    f"<td>{os.path.basename(r.file_path)}</td>"
+                    f"<td class='{status_cls}'>{r.status_icon} {r.status}</td>"
+                    f"<td>{r.error_count}</td>"
+                    f"<td>{r.warning_count}</td>"
+                    f"<td>{r.duration_ms:.1f}ms</td>"
+                    f"</tr>"
+                )
+
+            f.write(middle.format(**fields))
+
+            # Error details
+            for r in results:
+                if r.errors:
+                    parts = [f'<div class="errors-section"><h3>{os.path.basename(r.file_path)}</h3>']
+                    for e in r.errors:
+                        sev_cls = f"severity-{e.severity.value.lower()}"
+                        parts.append(
+                            f'<div class="error-item {sev_cls}">'
+                            f"[{e.code}] Line {e.line or '?'}: {e.message}"
+                            f"</div>"
+                        )
+                    parts.append("</div>")
+                    f.write("".join(parts))
+
+            f.write(foot.format(**fields))
 
         logger.info("HTML report exported to %s", output_path)
         return True
@@ -27,7 +27,7 @@ def export_json(results: List[ValidationResult], output_path: str) -> bool:
         True on success
     """
     try:
-        report = {
+        header = {
             "generator": f"{APP_NAME} v{APP_VERSION}",
             "generated_at": datetime.now().isoformat(),
             "summary": {
@@ -38,35 +38,19 @@ def export_json(results: List[ValidationResult], output_path: str) -> bool:
                 "total_errors": sum(r.error_count for r in results),
                 "total_warnings": sum(r.warning_count for r in results),
             },
-            "files": [],
         }
 
-        for r in results:
-            file_entry = {
-                "file": os.path.basename(r.file_path),
-                "path": r.file_path,
-                "status": r.status,
-                "error_count": r.error_count,
-                "warning_count": r.warning_count,
-                "duration_ms": r.duration_ms,
-                "errors": [
-                    {
-                        "code": e.code,
-                        "message": e.message,
-                        "line": e.line,
-                        "col": e.col,
-                        "severity": str(e.severity),
-                        "context": e.context_data,
-                        "suggestion": e.suggestion,
-                        "auto_fixable": e.auto_fixable,
-                    }
-                    for e in r.errors
-                ],
-            }
-            report["files"].append(file_entry)
-
+        # The "files" array is written one entry at a time, in the same
+        # layout json.dump(indent=2) gives, so the full report is never
+        # built in memory
         with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+            f.write(json.dumps(header, indent=2, ensure_ascii=False)[:-2])
+            f.write(',\n  "files": [')
+            for i, r in enumerate(results):
+                f.write(",\n    " if i else "\n    ")
+                entry = json.dumps(_file_entry(r), indent=2, ensure_ascii=False)
+                f.write(entry.replace("\n", "\n    "))
+            f.write("\n  ]\n}" if results else "]\n}")
 
         logger.info("JSON report exported to %s", output_path)
         return True
@@ -74,3 +58,28 @@ def export_json(results: List[ValidationResult], output_path: str) -> bool:
     except Exception as e:
         logger.error("Failed to export JSON report: %s", e)
         return False
+
+
+def _file_entry(r: ValidationResult) -> dict:
+    """JSON object for one file's results."""
+    return {
+        "file": os.path.basename(r.file_path),
+        "path": r.file_path,
+        "status": r.status,
+        "error_count": r.error_count,
+        "warning_count": r.warning_count,
+        "duration_ms": r.duration_ms,
+        "errors": [
+            {
+                "code": e.code,
+                "message": e.message,
+                "line": e.line,
+                "col": e.col,
+                "severity": str(e.severity),
+                "context": e.context_data,
+                "suggestion": e.suggestion,
+                "auto_fixable": e.auto_fixable,
+            }
+            for e in r.errors
+        ],
+    }
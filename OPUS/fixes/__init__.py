@@ -6,5 +6,5 @@ from .fix_generator import generate_fix
 from .auto_fixer import apply_auto_fix, batch_auto_fix
 from .knowledge_base import (
     get_knowledge, get_class_reference, get_method_reference,
-    get_missing_params_info,
+    get_missing_params_info, render_mistakes, clear_reference_cache,
 )
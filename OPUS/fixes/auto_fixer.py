@@ -4,7 +4,6 @@ Auto-fix engine for TestNG XML validation errors.
 Applies safe, reversible fixes to XML files based on error codes.
 """
 
-import os
 import shutil
 import logging
 from typing import List, Tuple
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Attribute validation entries (E18x) for the knowledge base.
+Imported by knowledge_base.py the first time one of these codes is needed.
+"""
+
+from typing import Dict
+
+
+KB: Dict[str, dict] = {
+
+    # ══════════════════════════════════════════════════════════
+    # ATTRIBUTE VALIDATION
+    # ══════════════════════════════════════════════════════════
+
+    "E184": {
+        "explain": (
+            "A boolean attribute has an invalid value. Boolean attributes in TestNG "
+            "XML only accept 'true' or 'false' (lowercase).\n\n"
+            "Common boolean attributes: allow-return-values, group-by-instances, "
+            "skip-failed-invocation-counts."
+        ),
+        "sample": """\
+<!-- Boolean attributes use true/false -->
+<suite name="MySuite" allow-return-values="true">
+<test name="MyTest" group-by-instances="false">""",
+        "mistakes": (
+            'Using "yes"/"no" instead of "true"/"false"',
+            'Using "1"/"0" instead of "true"/"false"',
+            'Using uppercase: "TRUE" or "False"',
+        ),
+    },
+
+    "E185": {
+        "explain": (
+            "A numeric attribute has an invalid value. This attribute expects "
+            "a number (integer), but you provided something that isn't a valid number."
+        ),
+        "sample": """\
+<!-- Numeric attributes need integer values -->
+<suite name="MySuite" thread-count="5" verbose="2">
+<test name="MyTest" invocation-count="3">""",
+        "mistakes": (
+            'Using text: thread-count="five"',
+            'Using decimal: thread-count="2.5" (must be integer)',
+            'Using negative: thread-count="-1"',
+        ),
+    },
+
+    "E180": {
+        "explain": (
+            "The 'parallel' attribute controls how TestNG runs tests concurrently. "
+            "Only specific values are allowed:\n\n"
+            "  • false/none — No parallel execution (default)\n"
+            "  • methods — Run test methods in parallel\n"
+            "  • tests — Run <test> blocks in parallel\n"
+            "  • classes — Run test classes in parallel\n"
+            "  • instances — Run test instances in parallel"
+        ),
+        "sample": """\
+<!-- Run methods in parallel with 5 threads -->
+<suite name="MySuite" parallel="methods" thread-count="5">
+  ...
+</suite>""",
+        "mistakes": (
+            'parallel="true" (not a valid value, use "methods" etc.)',
+            'parallel="parallel" (not a valid value)',
+        ),
+    },
+
+    "E181": {
+        "explain": (
+            "The 'thread-count' attribute must be a positive integer. It controls "
+            "how many threads TestNG uses for parallel execution.\n\n"
+            "Typical values: 2-10 for most projects. Higher values use more CPU."
+        ),
+        "sample": '<suite name="MySuite" parallel="methods" thread-count="5">',
+        "mistakes": (
+            'thread-count="abc" (not a number)',
+            'thread-count="-1" (must be positive)',
+            'thread-count="0" (must be at least 1)',
+        ),
+    },
+
+    "E182": {
+        "explain": (
+            "The 'verbose' attribute controls log detail level. "
+            "Valid range: 0 (silent) to 10 (maximum detail).\n\n"
+            "  • 0 = No output\n"
+            "  • 1 = Minimal (default)\n"
+            "  • 2-3 = Normal detail\n"
+            "  • 10 = Full debug output"
+        ),
+        "sample": '<suite name="MySuite" verbose="2">',
+        "mistakes": (
+            'verbose="high" (must be a number)',
+            'verbose="99" (max is 10)',
+        ),
+    },
+
+    "E183": {
+        "explain": (
+            "The 'preserve-order' attribute must be 'true' or 'false'. "
+            "When true, TestNG runs tests in the order they appear in the XML file."
+        ),
+        "sample": '<test name="OrderedTest" preserve-order="true">',
+        "mistakes": (
+            'preserve-order="yes" (must be true/false)',
+        ),
+    },
+}
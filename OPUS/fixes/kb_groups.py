@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Group configuration entries (E4xx) for the knowledge base.
+Imported by knowledge_base.py the first time one of these codes is needed.
+"""
+
+from typing import Dict
+
+
+KB: Dict[str, dict] = {
+
+    # ══════════════════════════════════════════════════════════
+    # GROUP ERRORS
+    # ══════════════════════════════════════════════════════════
+
+    "E400": {
+        "explain": (
+            "The <groups> configuration is invalid. Groups in TestNG allow you to "
+            "categorize test methods and run specific categories.\n\n"
+            "A valid <groups> block goes inside <test> and contains <run> with "
+            "<include> and/or <exclude> for group names."
+        ),
+        "sample": """\
+<test name="GroupedTests">
+  <groups>
+    <run>
+      <include name="smoke"/>
+      <exclude name="slow"/>
+    </run>
+  </groups>
+  <classes>
+    <class name="com.example.AllTests"/>
+  </classes>
+</test>""",
+        "mistakes": (
+            "Missing the <run> element inside <groups>",
+            "Putting <groups> outside of a <test> block",
+            "Using invalid group configuration syntax",
+        ),
+    },
+
+    "E401": {
+        "explain": (
+            "Your <groups> block is empty — it has no configuration inside. "
+            "An empty <groups> block has no effect.\n\n"
+            "Either add group include/exclude rules, or remove the empty "
+            "<groups> block entirely."
+        ),
+        "sample": """\
+<groups>
+  <run>
+    <include name="regression"/>
+  </run>
+</groups>""",
+        "mistakes": (
+            "Empty <groups></groups> block",
+            "Forgetting to add <run> with <include>/<exclude>",
+        ),
+    },
+}
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Metadata / Maven entries (E3xx) for the knowledge base.
+Imported by knowledge_base.py the first time one of these codes is needed.
+"""
+
+from typing import Dict
+
+
+KB: Dict[str, dict] = {
+
+    # ══════════════════════════════════════════════════════════
+    # METADATA / MAVEN ERRORS
+    # ══════════════════════════════════════════════════════════
+
+    "E300": {
+        "explain": (
+            "The class name in your XML was not found in the loaded Maven/JAR metadata. "
+            "This means either:\n\n"
+            "  1. The class name has a typo (check spelling carefully)\n"
+            "  2. The class is in a different package (check the package path)\n"
+            "  3. The class exists in a JAR that hasn't been scanned yet\n"
+            "  4. The class was removed or renamed in a newer version\n\n"
+            "Tip: Check the 'Reference' tab for similar class names from "
+            "the scanned JARs."
+        ),
+        "sample": """\
+<!-- Ensure the FULL package path is correct -->
+<class name="com.example.api.operation.MyTestClass"/>
+
+<!-- Common mistake: missing a package segment -->
+<!-- WRONG: com.example.MyTestClass -->
+<!-- RIGHT: com.example.api.operation.MyTestClass -->""",
+        "mistakes": (
+            "Missing intermediate package: com.example.MyClass vs com.example.sub.MyClass",
+            "Case mismatch: com.example.myclass vs com.example.MyClass",
+            "Old class name after refactoring",
+        ),
+    },
+
+    "E301": {
+        "explain": (
+            "The method name was not found in the specified class. This means "
+            "the method doesn't exist in the JAR metadata for that class.\n\n"
+            "Possible causes:\n"
+            "  1. Typo in the method name (check spelling and case)\n"
+            "  2. The method was renamed or removed\n"
+            "  3. The method is in a parent/superclass (not always detected)\n\n"
+            "Tip: Check the 'Reference' tab to see all available methods in the class."
+        ),
+        "sample": """\
+<class name="com.example.LoginTest">
+  <methods>
+    <include name="testValidLogin"/>  <!-- must match exactly -->
+  </methods>
+</class>""",
+        "mistakes": (
+            "Case mismatch: testlogin vs testLogin",
+            "Extra/missing prefix: test_login vs testLogin",
+            "Method was removed in latest JAR version",
+        ),
+    },
+
+    "E302": {
+        "explain": (
+            "The number of <parameter> tags doesn't match what the method expects "
+            "based on its Java signature.\n\n"
+            "This is a WARNING because:\n"
+            "  • Some parameters may have default values in the Java code\n"
+            "  • Parameters can be inherited from the parent <test> or <suite> level\n"
+            "  • The method may use @Optional annotations for some parameters\n"
+            "  • TestNG can inject certain values automatically\n\n"
+            "This warning is safe to ignore if your tests run correctly.\n\n"
+            "Check the 'Reference' tab to see the method's full parameter list "
+            "and determine which parameters might be missing or extra."
+        ),
+        "sample": """\
+<!-- If method expects 3 params: routerId, vrf, detailed -->
+<include name="getBgpNeighborTable">
+  <parameter name="routerId" value="10.0.0.1"/>
+  <parameter name="vrf" value="0"/>
+  <parameter name="detailed" value="true"/>
+</include>""",
+        "mistakes": (
+            "Forgetting optional parameters",
+            "Adding extra parameters not in the method signature",
+            "Parameters defined at suite/test level being counted separately",
+        ),
+    },
+
+    "E303": {
+        "explain": (
+            "The parameter value doesn't match any of the allowed enum values "
+            "from the Java code.\n\n"
+            "Java enums are a fixed set of allowed values. Using anything else "
+            "will cause a runtime error in your tests.\n\n"
+            "Check the 'Reference' tab for the complete list of valid values."
+        ),
+        "sample": """\
+<!-- Use exactly one of the valid enum values -->
+<parameter name="protocol" value="BGP"/>  <!-- must match enum -->""",
+        "mistakes": (
+            "Case mismatch: 'bgp' vs 'BGP'",
+            "Typo in enum value",
+            "Using a value from a different enum type",
+        ),
+    },
+
+    "E310": {
+        "explain": (
+            "A <suite-file> reference points to a file that doesn't exist. "
+            "Suite files let you compose multiple suite XMLs together.\n\n"
+            "Check that the file path is correct and the file exists relative "
+            "to your project directory."
+        ),
+        "sample": """\
+<suite name="MasterSuite">
+  <suite-files>
+    <suite-file path="smoke-tests.xml"/>
+    <suite-file path="regression-tests.xml"/>
+  </suite-files>
+</suite>""",
+        "mistakes": (
+            "Wrong file path or spelling",
+            "File was moved or renamed",
+            "Using absolute path when relative is needed",
+        ),
+    },
+}
@@ -0,0 +1,629 @@
+#!/usr/bin/env python3
+"""
+Structural error entries (E1xx, E2xx) for the knowledge base.
+Imported by knowledge_base.py the first time one of these codes is needed.
+"""
+
+from typing import Dict
+
+
+# ─── Shared Sample Fragments ─────────────────────────────────
+# Snippets reused verbatim by several entries' samples.
+_XML_HEADER = '<?xml version="1.0" encoding="UTF-8"?>\n'
+_DOCTYPE = '<!DOCTYPE suite SYSTEM "https://testng.org/testng-1.0.dtd">\n'
+_MINIMAL_SUITE = """\
+<suite name="MySuite">
+  <test name="MyTest">
+    <classes>
+      <class name="com.example.TestClass"/>
+    </classes>
+  </test>
+</suite>"""
+_PACKAGE_TEST = """\
+<test name="PackageTest">
+  <packages>
+    <package name="com.example.tests.*"/>
+  </packages>
+</test>"""
+_COMPLETE_SUITE = _XML_HEADER + _DOCTYPE + _MINIMAL_SUITE
+_BROWSER_PARAMETER = '<parameter name="browser" value="chrome"/>'
+
+KB: Dict[str, dict] = {
+
+    # ══════════════════════════════════════════════════════════
+    # STRUCTURAL ERRORS
+    # ══════════════════════════════════════════════════════════
+
+    "E100": {
+        "explain": (
+            "XML Syntax Error means your file has a fundamental formatting problem "
+            "that prevents it from being read at all.\n\n"
+            "Think of XML like parentheses in math — every opening tag <tag> needs "
+            "a matching closing tag </tag>, every quote must be paired, and special "
+            "characters like & must be written as &amp;.\n\n"
+            "The XML parser stopped reading your file at this point because it "
+            "encountered something it couldn't understand."
+        ),
+        "sample": _COMPLETE_SUITE,
+        "mistakes": (
+            'Missing closing quote: name="MySuite  (missing the second ")',
+            "Missing closing bracket: <suite name='MySuite'  (missing >)",
+            "Mismatched tags: <suite>...</test> (opened suite, closed test)",
+            "Special characters: Using & instead of &amp; in attribute values",
+            "Unclosed tags: Forgetting </suite> at the end of the file",
+        ),
+    },
+
+    "E101": {
+        "explain": (
+            "Every TestNG suite MUST have a name attribute. The name is used in "
+            "test reports, logging, and to identify your test suite.\n\n"
+            "Without a name, TestNG cannot properly generate reports or identify "
+            "which suite produced which results."
+        ),
+        "sample": """\
+<suite name="RegressionSuite" verbose="1">
+  <test name="SmokeTests">
+    <classes>
+      <class name="com.example.SmokeTest"/>
+    </classes>
+  </test>
+</suite>""",
+        "mistakes": (
+            '<suite> without any name attribute',
+            '<suite name=""> with empty name',
+            'Typo in attribute: <suite nme="MySuite">',
+        ),
+    },
+
+    "E102": {
+        "explain": (
+            "A TestNG XML file can only have ONE root <suite> element. "
+            "If you need multiple suites, create separate XML files for each.\n\n"
+            "Think of the <suite> tag as the container for your entire test "
+            "configuration — you can have many <test> blocks inside one suite, "
+            "but only one suite per file."
+        ),
+        "sample": """\
+<!-- ONE suite with MULTIPLE tests -->
+<suite name="AllTests">
+  <test name="UnitTests">...</test>
+  <test name="IntegrationTests">...</test>
+  <test name="E2ETests">...</test>
+</suite>""",
+        "mistakes": (
+            "Having two <suite> tags in one file",
+            "Copy-pasting another suite XML without removing the outer <suite>",
+        ),
+    },
+
+    "E103": {
+        "explain": (
+            "Every <test> element MUST have a name attribute. Test names appear "
+            "in reports and logs, making it easy to identify which test group "
+            "passed or failed.\n\n"
+            "Choose descriptive names like 'LoginTests' or 'PaymentFlow' rather "
+            "than generic names like 'Test1'."
+        ),
+        "sample": """\
+<test name="LoginTests" preserve-order="true">
+  <classes>
+    <class name="com.example.LoginTest"/>
+  </classes>
+</test>""",
+        "mistakes": (
+            '<test> without name attribute',
+            '<test name=""> with empty name',
+        ),
+    },
+
+    "E104": {
+        "explain": (
+            "Each <test> in a suite must have a UNIQUE name. Duplicate names "
+            "cause confusion in reports — you won't know which 'Test1' passed "
+            "and which failed.\n\n"
+            "TestNG uses the test name as an identifier, so duplicates can "
+            "cause unexpected behavior in parallel execution and reporting."
+        ),
+        "sample": """\
+<suite name="MySuite">
+  <test name="LoginTests">...</test>
+  <test name="PaymentTests">...</test>
+  <test name="ProfileTests">...</test>
+</suite>""",
+        "mistakes": (
+            "Copy-pasting a <test> block without changing the name",
+            "Using generic names like 'Test' for multiple blocks",
+        ),
+    },
+
+    "E105": {
+        "explain": (
+            "Your XML file doesn't have a <suite> root element. Every TestNG "
+            "XML file MUST start with <suite> as the root tag.\n\n"
+            "The <suite> tag is the top-level container that holds all your "
+            "test configurations. Without it, TestNG doesn't know how to "
+            "interpret the file."
+        ),
+        "sample": _COMPLETE_SUITE,
+        "mistakes": (
+            "Starting the file with <test> instead of <suite>",
+            "Missing the <suite> wrapper entirely",
+            "Using a different root element like <configuration>",
+        ),
+    },
+
+    "E106": {
+        "explain": (
+            "Your <suite> tag has no <test> elements inside it. An empty suite "
+            "won't run any tests.\n\n"
+            "You need at least one <test> block containing either <classes> or "
+            "<packages> to define what TestNG should execute."
+        ),
+        "sample": """\
+<suite name="MySuite">
+  <test name="SmokeTest">
+    <classes>
+      <class name="com.example.SmokeTest"/>
+    </classes>
+  </test>
+</suite>""",
+        "mistakes": (
+            "Creating a suite with only listeners but no tests",
+            "Accidentally deleting all <test> blocks",
+        ),
+    },
+
+    "E107": {
+        "explain": (
+            "Your <classes> block is empty — it has no <class> tags inside. "
+            "TestNG needs at least one class to know which test classes to run.\n\n"
+            "Each <class> tag points to a Java test class by its fully-qualified "
+            "name (package + class name)."
+        ),
+        "sample": """\
+<classes>
+  <class name="com.example.tests.LoginTest"/>
+  <class name="com.example.tests.SignupTest"/>
+</classes>""",
+        "mistakes": (
+            "Empty <classes></classes> block",
+            "Putting class names as text instead of <class> tags",
+        ),
+    },
+
+    "E108": {
+        "explain": (
+            "Your <methods> block is empty — it has no <include> or <exclude> "
+            "tags inside. If you don't specify methods, TestNG runs ALL methods "
+            "in the class.\n\n"
+            "Use <include> to run specific methods, or <exclude> to skip "
+            "specific methods. If you want all methods, remove the <methods> block entirely."
+        ),
+        "sample": """\
+<class name="com.example.LoginTest">
+  <methods>
+    <include name="testValidLogin"/>
+    <include name="testInvalidPassword"/>
+    <exclude name="testSlowLogin"/>
+  </methods>
+</class>""",
+        "mistakes": (
+            "Empty <methods></methods> block",
+            "Wanting to run all methods but still having an empty <methods> tag",
+        ),
+    },
+
+    "E109": {
+        "explain": (
+            "Your <packages> block is empty — it has no <package> tags inside. "
+            "TestNG needs at least one package to scan for test classes.\n\n"
+            "Package scanning lets you include all test classes in a package "
+            "without listing them individually."
+        ),
+        "sample": """\
+<packages>
+  <package name="com.example.tests.*"/>
+  <package name="com.example.integration"/>
+</packages>""",
+        "mistakes": (
+            "Empty <packages></packages> block",
+            "Forgetting to add the .* wildcard for sub-packages",
+        ),
+    },
+
+    "E110": {
+        "explain": (
+            "You placed <classes> directly under <suite>. The correct hierarchy is:\n\n"
+            "  <suite> → <test> → <classes> → <class>\n\n"
+            "<classes> MUST be inside a <test> block. The <test> groups related "
+            "classes together and controls execution settings like parallel mode."
+        ),
+        "sample": _MINIMAL_SUITE,
+        "mistakes": (
+            "Putting <classes> directly under <suite> without a <test> wrapper",
+        ),
+    },
+
+    "E111": {
+        "explain": (
+            "You placed a <class> tag outside of a <classes> container. "
+            "The correct hierarchy is:\n\n"
+            "  <test> → <classes> → <class>\n\n"
+            "Every <class> tag must be wrapped in a <classes> block."
+        ),
+        "sample": """\
+<test name="MyTest">
+  <classes>
+    <class name="com.example.TestClass"/>
+  </classes>
+</test>""",
+        "mistakes": (
+            "Putting <class> directly under <test> without <classes> wrapper",
+        ),
+    },
+
+    "E112": {
+        "explain": (
+            "Your <class> tag is missing the 'name' attribute. The name must be "
+            "the fully-qualified Java class name (package + class).\n\n"
+            "Example: com.example.tests.LoginTest\n"
+            "This tells TestNG exactly which Java class contains your test methods."
+        ),
+        "sample": '<class name="com.example.tests.LoginTest"/>',
+        "mistakes": (
+            "<class/> without any attributes",
+            '<class className="..."/> (wrong attribute name)',
+        ),
+    },
+
+    "E113": {
+        "explain": (
+            "You placed <packages> outside a <test> block. The correct hierarchy is:\n\n"
+            "  <suite> → <test> → <packages> → <package>\n\n"
+            "<packages> MUST be inside a <test> element."
+        ),
+        "sample": _PACKAGE_TEST,
+        "mistakes": (
+            "Putting <packages> directly under <suite>",
+        ),
+    },
+
+    "E114": {
+        "explain": (
+            "You have both <classes> and <packages> inside the same <test> block. "
+            "TestNG allows EITHER <classes> OR <packages> in a single <test>, not both.\n\n"
+            "Choose one approach:\n"
+            "  • <classes> — List specific test classes by name\n"
+            "  • <packages> — Scan entire packages for test classes\n\n"
+            "If you need both, create separate <test> blocks."
+        ),
+        "sample": """\
+<!-- Approach 1: Separate test blocks -->
+<suite name="MySuite">
+  <test name="SpecificTests">
+    <classes>
+      <class name="com.example.LoginTest"/>
+    </classes>
+  </test>
+  <test name="PackageTests">
+    <packages>
+      <package name="com.example.integration.*"/>
+    </packages>
+  </test>
+</suite>""",
+        "mistakes": (
+            "Mixing <classes> and <packages> in the same <test>",
+        ),
+    },
+
+    "E115": {
+        "explain": (
+            "You placed a <package> tag outside of a <packages> container. "
+            "The correct hierarchy is:\n\n"
+            "  <test> → <packages> → <package>\n\n"
+            "Every <package> tag must be wrapped in a <packages> block, "
+            "which itself must be inside a <test> block."
+        ),
+        "sample": _PACKAGE_TEST,
+        "mistakes": (
+            "Putting <package> directly under <test> without <packages> wrapper",
+            "Putting <package> under <suite> instead of inside <test> → <packages>",
+        ),
+    },
+
+    "E116": {
+        "explain": (
+            "Your <package> tag is missing the 'name' attribute. The name should "
+            "be a Java package path, optionally ending with .* for wildcard.\n\n"
+            "Example: com.example.tests.* (includes all classes in that package)"
+        ),
+        "sample": '<package name="com.example.tests.*"/>',
+        "mistakes": (
+            "<package/> without name attribute",
+            "Using class name instead of package name",
+        ),
+    },
+
+    "E117": {
+        "explain": (
+            "The package name doesn't follow Java naming conventions. "
+            "Valid package names:\n"
+            "  • Use lowercase letters, digits, underscores\n"
+            "  • Separate segments with dots (.)\n"
+            "  • Each segment starts with a letter or underscore\n"
+            "  • Can end with .* for wildcard scanning"
+        ),
+        "sample": """\
+<!-- Valid package names -->
+<package name="com.example.tests"/>
+<package name="com.example.tests.*"/>
+<package name="org.myproject.integration"/>""",
+        "mistakes": (
+            "Starting with a number: 1com.example",
+            "Using spaces: com. example.tests",
+            "Using hyphens: com.my-project.tests",
+        ),
+    },
+
+    "E121": {
+        "explain": (
+            "You placed an <include> tag in the wrong location. <include> tags "
+            "are used to specify which test methods to run and must be inside "
+            "a <methods> block.\n\n"
+            "The correct hierarchy is:\n"
+            "  <class> → <methods> → <include>"
+        ),
+        "sample": """\
+<class name="com.example.LoginTest">
+  <methods>
+    <include name="testValidLogin"/>
+    <include name="testInvalidLogin"/>
+  </methods>
+</class>""",
+        "mistakes": (
+            "Putting <include> directly under <class> without <methods> wrapper",
+            "Putting <include> outside of any <class> block",
+        ),
+    },
+
+    "E123": {
+        "explain": (
+            "You placed an <exclude> tag in the wrong location. <exclude> tags "
+            "are used to skip specific test methods and must be inside "
+            "a <methods> block.\n\n"
+            "The correct hierarchy is:\n"
+            "  <class> → <methods> → <exclude>"
+        ),
+        "sample": """\
+<class name="com.example.LoginTest">
+  <methods>
+    <exclude name="testSlowMethod"/>
+  </methods>
+</class>""",
+        "mistakes": (
+            "Putting <exclude> directly under <class> without <methods> wrapper",
+        ),
+    },
+
+    "E120": {
+        "explain": (
+            "You placed <methods> outside a <class> block. The correct hierarchy is:\n\n"
+            "  <class> → <methods> → <include>/<exclude>\n\n"
+            "<methods> defines which specific methods to run (or skip) in a class."
+        ),
+        "sample": """\
+<class name="com.example.LoginTest">
+  <methods>
+    <include name="testValidLogin"/>
+  </methods>
+</class>""",
+        "mistakes": (
+            "Putting <methods> directly under <test> or <classes>",
+        ),
+    },
+
+    "E122": {
+        "explain": (
+            "Your <include> tag is missing the 'name' attribute. The name must be "
+            "the exact method name from your Java test class.\n\n"
+            "Note: Method names are case-sensitive! 'testLogin' ≠ 'TestLogin'"
+        ),
+        "sample": '<include name="testValidLogin"/>',
+        "mistakes": (
+            "<include/> without name",
+            "Typo in the method name",
+        ),
+    },
+
+    "E124": {
+        "explain": (
+            "Your <exclude> tag is missing the 'name' attribute. <exclude> is used "
+            "to skip specific test methods.\n\n"
+            "Tip: Use <exclude> when you want to run most methods but skip a few."
+        ),
+        "sample": '<exclude name="testSlowMethod"/>',
+        "mistakes": (
+            "<exclude/> without name",
+        ),
+    },
+
+    "E130": {
+        "explain": (
+            "Your <parameter> tag is missing the 'name' attribute. Parameters are "
+            "key-value pairs that pass data to your test methods.\n\n"
+            "In your Java code, you use @Parameters({\"paramName\"}) to receive "
+            "these values. The 'name' here must match what your Java code expects."
+        ),
+        "sample": _BROWSER_PARAMETER,
+        "mistakes": (
+            "<parameter value='chrome'/> (missing name)",
+            "<parameter> without any attributes",
+        ),
+    },
+
+    "E131": {
+        "explain": (
+            "Your <parameter> tag is missing the 'value' attribute. Every parameter "
+            "needs both a name AND a value.\n\n"
+            "The value is what gets passed to your test method at runtime."
+        ),
+        "sample": _BROWSER_PARAMETER,
+        "mistakes": (
+            '<parameter name="browser"/> (missing value)',
+        ),
+    },
+
+    "E132": {
+        "explain": (
+            "The same parameter name appears more than once in the same scope. "
+            "Parameter names must be unique within their parent element.\n\n"
+            "If you need different values for the same parameter, define them at "
+            "different levels (suite vs test vs class)."
+        ),
+        "sample": """\
+<!-- Parameters at different levels -->
+<suite name="MySuite">
+  <parameter name="env" value="staging"/>  <!-- suite level -->
+  <test name="Test1">
+    <parameter name="browser" value="chrome"/>  <!-- test level -->
+    ...
+  </test>
+</suite>""",
+        "mistakes": (
+            "Defining the same parameter twice in one <test> block",
+            "Copy-pasting parameters without removing duplicates",
+        ),
+    },
+
+    "E160": {
+        "explain": (
+            "The same class appears more than once in a <test> block. This means "
+            "the class's tests would run twice, which is usually unintentional.\n\n"
+            "If you need to run the same class with different configurations, "
+            "put them in separate <test> blocks with different parameters."
+        ),
+        "sample": """\
+<test name="MyTest">
+  <classes>
+    <class name="com.example.LoginTest"/>  <!-- only once! -->
+    <class name="com.example.SignupTest"/>
+  </classes>
+</test>""",
+        "mistakes": (
+            "Listing the same class twice in <classes>",
+            "Copy-paste without cleanup",
+        ),
+    },
+
+    "E161": {
+        "explain": (
+            "The same method is included more than once in the <methods> block. "
+            "TestNG will only run it once anyway, so the duplicate is unnecessary.\n\n"
+            "Remove the extra <include> to keep your XML clean."
+        ),
+        "sample": """\
+<methods>
+  <include name="testLogin"/>  <!-- only once! -->
+  <include name="testLogout"/>
+</methods>""",
+        "mistakes": (
+            "Including the same method twice",
+        ),
+    },
+
+    "E170": {
+        "explain": (
+            "Spaces are NOT allowed in Java class names or method names. "
+            "If you see spaces, it's likely a copy-paste error or accidental keypress.\n\n"
+            "Note: Spaces ARE allowed in <test> and <suite> names — just not in "
+            "<class> names or <include>/<exclude> method names."
+        ),
+        "sample": """\
+<!-- CORRECT: No spaces in class/method names -->
+<class name="com.example.tests.LoginTest"/>
+<include name="testValidLogin"/>
+
+<!-- Spaces OK in test/suite names -->
+<test name="Login Tests - Chrome">""",
+        "mistakes": (
+            "Accidental spaces in class name: 'com.example. LoginTest'",
+            "Trailing/leading spaces: ' testLogin '",
+            "Spaces in method name from copy-paste",
+        ),
+    },
+
+    "E145": {
+        "explain": (
+            "You placed <listeners> in an invalid location. The <listeners> block "
+            "must be a direct child of <suite>.\n\n"
+            "Listeners are classes that receive TestNG events (like test start, "
+            "test pass/fail) and can perform actions like taking screenshots, "
+            "logging, or generating custom reports."
+        ),
+        "sample": """\
+<suite name="MySuite">
+  <listeners>
+    <listener class-name="com.example.TestListener"/>
+    <listener class-name="com.example.ReportListener"/>
+  </listeners>
+  <test name="MyTest">...</test>
+</suite>""",
+        "mistakes": (
+            "Putting <listeners> inside a <test> block instead of directly under <suite>",
+            "Putting <listeners> inside <classes> or <methods>",
+        ),
+    },
+
+    "E200": {
+        "explain": (
+            "The XML structure doesn't match what TestNG expects. This usually "
+            "means a tag was found in the wrong place.\n\n"
+            "TestNG has a specific tag hierarchy:\n"
+            "  suite → test → classes → class → methods → include/exclude\n\n"
+            "Make sure each tag is nested correctly inside its parent."
+        ),
+        "sample": """\
+<suite name="MySuite">
+  <test name="MyTest">
+    <classes>
+      <class name="com.example.Test">
+        <methods>
+          <include name="testMethod"/>
+        </methods>
+      </class>
+    </classes>
+  </test>
+</suite>""",
+        "mistakes": (
+            "Nesting tags in the wrong order",
+            "Missing an intermediate container tag",
+        ),
+    },
+
+    "E201": {
+        "explain": (
+            "A tag was opened but never properly closed. Every opening tag "
+            "needs a matching closing tag.\n\n"
+            "Examples of matching pairs:\n"
+            "  <suite>...</suite>\n"
+            "  <test>...</test>\n"
+            "  <classes>...</classes>\n\n"
+            "Self-closing tags like <class name='...'/> don't need a separate closing tag."
+        ),
+        "sample": """\
+<!-- All tags properly closed -->
+<suite name="MySuite">
+  <test name="MyTest">
+    <classes>
+      <class name="com.example.Test"/>  <!-- self-closing -->
+    </classes>
+  </test>
+</suite>""",
+        "mistakes": (
+            "Forgetting </suite> at the end of the file",
+            "Forgetting </test> after a test block",
+            "Forgetting </classes> or </methods>",
+        ),
+    },
+}
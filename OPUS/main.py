@@ -13,11 +13,12 @@ import sys
 import os
 import argparse
 import logging
+import multiprocessing
 
 # Ensure the parent directory is on the path for relative imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from OPUS.config import APP_TITLE, APP_VERSION
+from OPUS.config import APP_TITLE, APP_VERSION, CLI_OUTPUT_BATCH
 from OPUS.utils.logging_config import setup_logging
 
 
@@ -40,9 +41,7 @@ def run_gui():
 
 def run_cli(args):
     """Run validation in CLI mode."""
-    from OPUS.validators import validate_file
-    from OPUS.exporters import export_html, export_csv, export_json
-    from OPUS.utils.file_utils import find_xml_files
+    from OPUS.utils.file_utils import find_xml_files, intern_json_strings, load_json_file
 
     logger = logging.getLogger("testng_validator")
 
@@ -60,13 +59,13 @@ def run_cli(args):
         logger.error("No XML files found.")
         sys.exit(1)
 
+    from OPUS.validators import validate_files
+
     # Load metadata if provided
     metadata = None
     if args.metadata:
-        import json
         try:
-            with open(args.metadata, encoding='utf-8') as f:
-                metadata = json.load(f)
+            metadata = intern_json_strings(load_json_file(args.metadata))
             logger.info("Loaded metadata: %d classes", len(metadata))
         except Exception as e:
             logger.error("Failed to load metadata: %s", e)
@@ -81,21 +80,37 @@ def run_cli(args):
     print(f"Files to validate: {len(all_files)}")
     print("=" * 60)
 
-    for filepath in all_files:
-        result = validate_file(filepath, metadata)
-        results.append(result)
+    # Validate across worker processes when there are enough files; results
+    # come back in input order so output matches the sequential run.
+    # --debug stays in-process so worker log records are not lost.
+    result_iter = validate_files(all_files, metadata, jobs=1 if args.debug else args.jobs)
+
+    # Per-file report lines are written in batches rather than one print()
+    # per line; --verbose flushes every file for live feedback.
+    out_buf = []
+    try:
+        for filepath, result in zip(all_files, result_iter):
+            results.append(result)
 
-        icon = "\u2705" if result.is_valid else ("\u26a0\ufe0f" if result.error_count == 0 else "\u274c")
-        print(f"\n{icon} {os.path.basename(filepath)}")
-        print(f"   Status: {result.status} | Errors: {result.error_count} | Warnings: {result.warning_count} | Time: {result.duration_ms:.1f}ms")
+            icon = "\u2705" if result.is_valid else ("\u26a0\ufe0f" if result.error_count == 0 else "\u274c")
+            out_buf.append(f"\n{icon} {os.path.basename(filepath)}\n")
+            out_buf.append(f"   Status: {result.status} | Errors: {result.error_count} | Warnings: {result.warning_count} | Time: {result.duration_ms:.1f}ms\n")
 
-        if args.verbose and result.errors:
-            for e in result.errors:
-                sev_icon = "\u274c" if e.is_error else "\u26a0\ufe0f"
-                print(f"   {sev_icon} L{e.line or '?'} [{e.code}] {e.message}")
+            if args.verbose and result.errors:
+                for e in result.errors:
+                    sev_icon = "\u274c" if e.is_error else "\u26a0\ufe0f"
+                    out_buf.append(f"   {sev_icon} L{e.line or '?'} [{e.code}] {e.message}\n")
 
-        total_errors += result.error_count
-        total_warnings += result.warning_count
+            total_errors += result.error_count
+            total_warnings += result.warning_count
+
+            if args.verbose or len(results) % CLI_OUTPUT_BATCH == 0:
+                sys.stdout.write("".join(out_buf))
+                sys.stdout.flush()
+                out_buf.clear()
+    finally:
+        sys.stdout.write("".join(out_buf))
+        result_iter.close()
 
     # Summary
     print("\n" + "=" * 60)
@@ -114,10 +129,13 @@ def run_cli(args):
         ext = os.path.splitext(args.output)[1].lower()
         success = False
         if ext == ".html":
+            from OPUS.exporters import export_html
             success = export_html(results, args.output)
         elif ext == ".csv":
+            from OPUS.exporters import export_csv
             success = export_csv(results, args.output)
         elif ext == ".json":
+            from OPUS.exporters import export_json
             success = export_json(results, args.output)
         else:
             logger.error("Unsupported output format: %s (use .html, .csv, or .json)", ext)
@@ -130,6 +148,9 @@ def run_cli(args):
 
 
 def main():
+    # Worker processes (CLI validation, multi-JAR scans) in frozen builds
+    multiprocessing.freeze_support()
+
     parser = argparse.ArgumentParser(
         prog="testng-validator",
         description=f"{APP_TITLE} - TestNG XML Suite Validator",
@@ -140,6 +161,8 @@ def main():
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
     parser.add_argument("--metadata", "-m", type=str, help="Path to metadata JSON file")
     parser.add_argument("--output", "-o", type=str, help="Export report (supports .html, .csv, .json)")
+    parser.add_argument("--jobs", "-j", type=int, default=0,
+                        help="Worker processes for CLI validation (default: CPU count, 1 = sequential)")
     parser.add_argument("files", nargs="*", help="XML files or directories to validate")
 
     args = parser.parse_args()
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Minimal Java class file reader.
+Reads only what the Maven extractor needs: the class name, and each
+method's name, descriptor and RuntimeVisibleAnnotations type names.
+Constant pool strings are decoded lazily, and method bodies and every
+other attribute are skipped without being parsed.
+"""
+
+import struct
+from typing import Dict, List, Tuple, Union
+
+# Header: magic, minor, major, constant_pool_count
+_HEADER = struct.Struct('>IHHH')
+_U2 = struct.Struct('>H')
+_U2U2 = struct.Struct('>HH')
+# access_flags, name_index, descriptor_index, attributes_count
+_MEMBER = struct.Struct('>HHHH')
+# attribute_name_index, attribute_length
+_ATTR = struct.Struct('>HI')
+
+_MAGIC = 0xCAFEBABE
+
+# Constant pool tags
+_CP_UTF8 = 1
+_CP_CLASS = 7
+_CP_LONG = 5
+_CP_DOUBLE = 6
+
+# Payload size (after the tag byte) of every fixed-size constant
+_CP_SIZES = {
+    3: 4, 4: 4, 5: 8, 6: 8, 7: 2, 8: 2, 9: 4, 10: 4, 11: 4, 12: 4,
+    15: 3, 16: 2, 17: 4, 18: 4, 19: 2, 20: 2,
+}
+
+# element_value tags followed by a single u2 index
+_ELEMENT_U2_TAGS = frozenset(b'BCDFIJSZsc')
+
+# Field descriptor base types (the single-letter primitives)
+_BASE_TYPES = frozenset('BCDFIJSZ')
+
+MethodInfo = Tuple[str, str, List[str]]
+
+
+class _ConstantPool:
+    """Constant pool index -> offset table with on-demand UTF-8 decoding."""
+
+    __slots__ = ("_buf", "_tags", "_offsets", "_strings")
+
+    def __init__(self, buf, tags: List[int], offsets: List[int]):
+        self._buf = buf
+        self._tags = tags
+        self._offsets = offsets
+        self._strings: Dict[int, str] = {}
+
+    def utf8(self, index: int) -> str:
+        """Decode the Utf8 constant at index (cached per pool)."""
+        text = self._strings.get(index)
+        if text is None:
+            if self._tags[index] != _CP_UTF8:
+                raise ValueError(f"Constant #{index} is not Utf8")
+            ofs = self._offsets[index]
+            (length,) = _U2.unpack_from(self._buf, ofs)
+            # Class files use modified UTF-8; names are plain UTF-8 in practice
+            text = bytes(self._buf[ofs + 2:ofs + 2 + length]).decode('utf-8', 'replace')
+            self._strings[index] = text
+        return text
+
+    def class_name(self, index: int) -> str:
+        """Resolve a Class constant to its internal name (e.g. java/lang/String)."""
+        if self._tags[index] != _CP_CLASS:
+            raise ValueError(f"Constant #{index} is not a Class")
+        (name_index,) = _U2.unpack_from(self._buf, self._offsets[index])
+        return self.utf8(name_index)
+
+
+def _read_constant_pool(buf, count: int, pos: int) -> Tuple[_ConstantPool, int]:
+    """Record the tag and payload offset of every constant; return (pool, end)."""
+    tags = [0] * count
+    offsets = [0] * count
+    sizes = _CP_SIZES
+    index = 1
+    while index < count:
+        tag = buf[pos]
+        tags[index] = tag
+        offsets[index] = pos + 1
+        if tag == _CP_UTF8:
+            (length,) = _U2.unpack_from(buf, pos + 1)
+            pos += 3 + length
+        else:
+            size = sizes.get(tag)
+            if size is None:
+                raise ValueError(f"Unknown constant pool tag {tag} at #{index}")
+            pos += 1 + size
+        # Long and Double constants occupy two slots
+        index += 2 if tag in (_CP_LONG, _CP_DOUBLE) else 1
+    return _ConstantPool(buf, tags, offsets), pos
+
+
+def _skip_element_value(buf, pos: int) -> int:
+    """Return the offset just past the element_value at pos."""
+    tag = buf[pos]
+    pos += 1
+    if tag in _ELEMENT_U2_TAGS:
+        return pos + 2
+    if tag == 0x65:  # 'e': enum type + constant name
+        return pos + 4
+    if tag == 0x40:  # '@': nested annotation
+        return _skip_annotation(buf, pos)
+    if tag == 0x5B:  # '[': array of element values
+        (count,) = _U2.unpack_from(buf, pos)
+        pos += 2
+        for _ in range(count):
+            pos = _skip_element_value(buf, pos)
+        return pos
+    raise ValueError(f"Unknown annotation element tag {tag!r}")
+
+
+def _skip_annotation(buf, pos: int) -> int:
+    """Return the offset just past the annotation structure at pos."""
+    _, pairs = _U2U2.unpack_from(buf, pos)
+    pos += 4
+    for _ in range(pairs):
+        pos = _skip_element_value(buf, pos + 2)
+    return pos
+
+
+def _annotation_types(buf, pos: int, pool: _ConstantPool) -> List[str]:
+    """Type descriptors of a RuntimeVisibleAnnotations attribute body."""
+    (count,) = _U2.unpack_from(buf, pos)
+    pos += 2
+    types: List[str] = []
+    for _ in range(count):
+        (type_index,) = _U2.unpack_from(buf, pos)
+        types.append(pool.utf8(type_index))
+        pos = _skip_annotation(buf, pos)
+    return types
+
+
+def _skip_attributes(buf, pos: int, count: int) -> int:
+    """Return the offset just past count attribute_info structures."""
+    for _ in range(count):
+        _, length = _ATTR.unpack_from(buf, pos)
+        pos += 6 + length
+    return pos
+
+
+def parse_class(buf: Union[bytes, bytearray, memoryview]) -> dict:
+    """
+    Parse the parts of a class file the extractor uses.
+
+    Args:
+        buf: Raw class file bytes
+
+    Returns:
+        Dict with 'name' (internal form, e.g. com/example/Foo) and
+        'methods', a list of (name, descriptor, annotation type
+        descriptors) tuples in declaration order
+
+    Raises:
+        ValueError: If the data is not a well-formed class file
+    """
+    try:
+        magic, _, _, cp_count = _HEADER.unpack_from(buf, 0)
+        if magic != _MAGIC:
+            raise ValueError("Not a Java class file (bad magic)")
+        pool, pos = _read_constant_pool(buf, cp_count, _HEADER.size)
+
+        _, this_class = _U2U2.unpack_from(buf, pos)
+        # access_flags, this_class, super_class, interfaces_count
+        (interfaces,) = _U2.unpack_from(buf, pos + 6)
+        pos += 8 + 2 * interfaces
+
+        (fields,) = _U2.unpack_from(buf, pos)
+        pos += 2
+        for _ in range(fields):
+            attrs = _MEMBER.unpack_from(buf, pos)[3]
+            pos = _skip_attributes(buf, pos + 8, attrs)
+
+        (method_count,) = _U2.unpack_from(buf, pos)
+        pos += 2
+        methods: List[MethodInfo] = []
+        for _ in range(method_count):
+            _, name_index, desc_index, attrs = _MEMBER.unpack_from(buf, pos)
+            pos += 8
+            annotations: List[str] = []
+            for _ in range(attrs):
+                attr_name, length = _ATTR.unpack_from(buf, pos)
+                pos += 6
+                if pool.utf8(attr_name) == 'RuntimeVisibleAnnotations':
+                    annotations = _annotation_types(buf, pos, pool)
+                pos += length
+            methods.append((pool.utf8(name_index), pool.utf8(desc_index), annotations))
+
+        return {'name': pool.class_name(this_class), 'methods': methods}
+    except (struct.error, IndexError) as e:
+        raise ValueError(f"Truncated or malformed class file: {e}") from e
+
+
+def _field_end(desc: str, pos: int) -> int:
+    """Return the index just past the field descriptor starting at pos."""
+    start = pos
+    while desc[pos] == '[':
+        pos += 1
+    if desc[pos] == 'L':
+        end = desc.index(';', pos)
+        return end + 1
+    if desc[pos] in _BASE_TYPES or (desc[pos] == 'V' and pos == start):
+        return pos + 1
+    raise ValueError(f"Bad type descriptor in {desc!r}")
+
+
+def parse_method_descriptor(desc: str) -> Tuple[List[str], str]:
+    """
+    Split a method descriptor into parameter and return field descriptors.
+
+    Example: '(I[Ljava/lang/String;)V' -> (['I', '[Ljava/lang/String;'], 'V')
+
+    Raises:
+        ValueError: If the descriptor is malformed
+    """
+    if not desc.startswith('('):
+        raise ValueError(f"Bad method descriptor {desc!r}")
+    try:
+        args: List[str] = []
+        pos = 1
+        while desc[pos] != ')':
+            end = _field_end(desc, pos)
+            args.append(desc[pos:end])
+            pos = end
+        returns = desc[pos + 1:]
+        if _field_end(returns, 0) != len(returns):
+            raise ValueError(f"Bad method descriptor {desc!r}")
+    except IndexError as e:
+        raise ValueError(f"Bad method descriptor {desc!r}") from e
+    return args, returns
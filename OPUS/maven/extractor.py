@@ -6,11 +6,18 @@ and standalone JAR files for semantic validation of TestNG XML suites.
 """
 
 import os
-import io
-import json
+import re
+import sys
+import hashlib
 import zipfile
 import logging
-from typing import Dict, List, Optional, Callable
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Callable, Tuple
+
+from .classfile import parse_class, parse_method_descriptor
+from ..config import JAR_CACHE_DIR, JAR_CACHE_MAX_FILES, PARALLEL_MIN_JARS
+from ..utils.file_utils import intern_json_strings, load_json_file, save_json_file
 
 logger = logging.getLogger(__name__)
 
@@ -30,14 +37,21 @@ _COMMON_JAVA_TYPES = {
 }
 
 
+# Fields of a jawa JVMType repr string
+_JVM_TYPE_NAME_RE = re.compile(r"name='([^']*)'")
+_JVM_TYPE_DIM_RE = re.compile(r"dimensions=(\d+)")
+
+
 def _simplify_class_name(full_name: str) -> str:
     """Simplify a fully-qualified class name to its short form.
     e.g. 'java.lang.String' → 'String', 'com.example.Foo' → 'Foo'
     """
-    s = full_name.replace('/', '.')
-    if s in _COMMON_JAVA_TYPES:
-        return _COMMON_JAVA_TYPES[s]
-    return s.rsplit('.', 1)[-1] if '.' in s else s
+    return _simplify_dotted(full_name.replace('/', '.'))
+
+
+def _simplify_dotted(name: str) -> str:
+    """_simplify_class_name() for a name already in dotted form."""
+    return _COMMON_JAVA_TYPES.get(name) or name.rpartition('.')[2]
 
 
 def _clean_jvm_type(raw) -> str:
@@ -49,30 +63,48 @@ def _clean_jvm_type(raw) -> str:
       - Simple descriptors: I, J, Z, D, Ljava/lang/String;, [I
       - Already clean names: String, int, boolean
     """
+    # ── Descriptor strings from the class file reader (the common case) ──
+    if type(raw) is str:
+        s = raw.strip()
+        # Single-char primitives: every void return and int/boolean param
+        if len(s) == 1 and s in _JVM_PRIMITIVES:
+            return _JVM_PRIMITIVES[s]
+        return _clean_jvm_type_str(s)
+
     if raw is None:
         return 'unknown'
 
     # ── If it's a jawa JVMType object, use attrs directly ──
     if hasattr(raw, 'name') and hasattr(raw, 'dimensions'):
-        name = str(raw.name).replace('/', '.')
-        dims = int(raw.dimensions) if raw.dimensions else 0
-        clean = _JVM_PRIMITIVES.get(name, _simplify_class_name(name))
-        return clean + '[]' * dims
+        return _clean_named_type(str(raw.name), int(raw.dimensions) if raw.dimensions else 0)
 
-    s = str(raw).strip()
+    return _clean_jvm_type_str(str(raw).strip())
+
+
+# The same few descriptors (String, int, the TestNG annotations...) recur
+# across every method of every class in a JAR, so the string forms are
+# cleaned once each.
+
+@lru_cache(maxsize=4096)
+def _clean_named_type(name: str, dims: int) -> str:
+    """Clean a slash- or dot-separated type name with array dimensions."""
+    name = name.replace('/', '.')
+    clean = _JVM_PRIMITIVES.get(name) or _simplify_dotted(name)
+    return clean + '[]' * dims
+
+
+@lru_cache(maxsize=4096)
+def _clean_jvm_type_str(s: str) -> str:
+    """String half of _clean_jvm_type(); s is already stripped."""
     if not s:
         return 'unknown'
 
     # ── Parse JVMType(...) repr string ──
     if s.startswith('JVMType('):
-        import re
-        name_m = re.search(r"name='([^']*)'", s)
-        dim_m = re.search(r"dimensions=(\d+)", s)
+        name_m = _JVM_TYPE_NAME_RE.search(s)
+        dim_m = _JVM_TYPE_DIM_RE.search(s)
         if name_m:
-            name = name_m.group(1).replace('/', '.')
-            dims = int(dim_m.group(1)) if dim_m else 0
-            clean = _JVM_PRIMITIVES.get(name, _simplify_class_name(name))
-            return clean + '[]' * dims
+            return _clean_named_type(name_m.group(1), int(dim_m.group(1)) if dim_m else 0)
         return 'unknown'
 
     # ── Simple single-char JVM primitive ──
@@ -82,7 +114,7 @@ def _clean_jvm_type(raw) -> str:
     # ── Array types: [I, [Ljava/lang/String; ──
     if s.startswith('['):
         inner = s.lstrip('[')
-        return _clean_jvm_type(inner) + '[]'
+        return _clean_jvm_type_str(inner.strip()) + '[]' * (len(s) - len(inner))
 
     # ── Object reference: Ljava/lang/String; ──
     if s.startswith('L') and s.endswith(';'):
@@ -96,35 +128,133 @@ def _clean_annotation(raw) -> str:
     """Convert JVM annotation descriptor to short name.
     e.g. 'Lorg/testng/annotations/Test;' → 'Test'
     """
-    s = str(raw).strip()
+    return _clean_annotation_str(str(raw).strip())
+
+
+@lru_cache(maxsize=4096)
+def _clean_annotation_str(s: str) -> str:
+    """String half of _clean_annotation(); s is already stripped."""
     # Handle JVMType repr
     if s.startswith('JVMType('):
-        import re
-        name_m = re.search(r"name='([^']*)'", s)
+        name_m = _JVM_TYPE_NAME_RE.search(s)
         if name_m:
             s = name_m.group(1)
     # Strip L...; wrapper
     if s.startswith('L') and s.endswith(';'):
         s = s[1:-1]
-    return s.split('/')[-1].rstrip(';')
-
-
-# Lazy import for jawa (optional heavy dependency)
-_jawa_available = None
+    return s.rpartition('/')[2].rstrip(';')
+
+
+# Extracted method parameters: (name, type) pairs. The JSON metadata
+# format spells each one as {"name": ..., "type": ...}.
+ParamPairs = Tuple[Tuple[str, str], ...]
+
+
+def _json_metadata(metadata: Dict[str, dict]) -> Dict[str, dict]:
+    """Copy of metadata with parameter pairs written as JSON-format dicts."""
+    out: Dict[str, dict] = {}
+    for class_name, cls_meta in metadata.items():
+        methods = {}
+        for method_name, minfo in cls_meta.get('methods', {}).items():
+            params = minfo.get('parameters')
+            if isinstance(params, tuple):
+                minfo = dict(minfo)
+                minfo['parameters'] = [{'name': name, 'type': ptype} for name, ptype in params]
+            methods[method_name] = minfo
+        out[class_name] = dict(cls_meta, methods=methods)
+    return out
+
+
+_SKIPPED_JAR_SUFFIXES = ('-sources.jar', '-javadoc.jar')
+
+
+# Bump when the extracted metadata shape changes, to invalidate old caches
+_JAR_CACHE_VERSION = 1
+
+
+def _jar_cache_key(jar_path: str) -> Tuple[str, tuple]:
+    """Return (cache file name, (version, path, mtime_ns, size)) for a JAR."""
+    path = os.path.abspath(jar_path)
+    st = os.stat(path)
+    name = hashlib.sha1(path.encode('utf-8')).hexdigest() + '.json'
+    return name, (_JAR_CACHE_VERSION, path, st.st_mtime_ns, st.st_size)
+
+
+def _metadata_from_cache(metadata: Dict[str, dict]) -> Dict[str, dict]:
+    """Restore cached JSON metadata: interned strings, parameter pairs as tuples."""
+    metadata = intern_json_strings(metadata)
+    # JSON turns the pair tuples into lists; equal signatures share one tuple again
+    shared: Dict[ParamPairs, ParamPairs] = {}
+    for cls_meta in metadata.values():
+        for minfo in cls_meta.get('methods', {}).values():
+            params = tuple(tuple(p) for p in minfo.get('parameters', ()))
+            minfo['parameters'] = shared.setdefault(params, params)
+    return metadata
+
+
+def _load_cached_jar(jar_path: str, cache_path: str, key: tuple) -> Optional[Dict[str, dict]]:
+    """Cached metadata for a JAR if cache_path holds an entry for key, else None."""
+    try:
+        cached = load_json_file(cache_path)
+        if tuple(cached['key']) != key:
+            return None
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug("Ignoring unreadable cache %s: %s", cache_path, e)
+        return None
+    logger.info("Using cached metadata for %s", os.path.basename(jar_path))
+    try:
+        os.utime(cache_path)
+    except OSError:
+        pass
+    return _metadata_from_cache(cached['metadata'])
+
+
+def _cached_jar_metadata(jar_path: str, cache_dir: Optional[str] = None) -> Optional[Dict[str, dict]]:
+    """extract_cached() without the extraction: None unless the JAR is cached."""
+    try:
+        name, key = _jar_cache_key(jar_path)
+    except OSError:
+        return None
+    return _load_cached_jar(jar_path, os.path.join(cache_dir or str(JAR_CACHE_DIR), name), key)
+
+
+def _prune_jar_cache(cache_dir: str, max_files: int = JAR_CACHE_MAX_FILES) -> None:
+    """Remove the least recently used cache files beyond max_files."""
+    entries = []
+    try:
+        with os.scandir(cache_dir) as it:
+            for e in it:
+                if e.name.endswith('.json'):
+                    entries.append((e.stat().st_mtime, e.path))
+    except OSError:
+        return
+    if len(entries) <= max_files:
+        return
+    entries.sort()
+    for _, path in entries[:len(entries) - max_files]:
+        try:
+            os.remove(path)
+        except OSError as e:
+            logger.debug("Could not remove cache file %s: %s", path, e)
 
 
-def _check_jawa() -> bool:
-    """Check if jawa library is available."""
-    global _jawa_available
-    if _jawa_available is None:
+def _walk_jars(root: str) -> Iterator[str]:
+    """Yield class JARs under root, skipping -sources/-javadoc artifacts."""
+    stack = [root]
+    while stack:
+        directory = stack.pop()
         try:
-            from jawa.cf import ClassFile
-            from jawa.util.descriptor import method_descriptor
-            _jawa_available = True
-        except ImportError:
-            _jawa_available = False
-            logger.warning("jawa library not available. Install: pip install jawa")
-    return _jawa_available
+            with os.scandir(directory) as it:
+                for entry in it:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif name.endswith('.jar') and not name.endswith(_SKIPPED_JAR_SUFFIXES):
+                        yield entry.path
+        except OSError as e:
+            logger.debug("Skipping unreadable directory %s: %s", directory, e)
 
 
 class MavenMetadataExtractor:
@@ -176,28 +306,20 @@ class MavenMetadataExtractor:
             search_path = os.path.join(self.m2_repo, group_path, artifact_id)
 
             if os.path.exists(search_path):
-                for root, _, files in os.walk(search_path):
-                    for file in files:
-                        if (file.endswith('.jar')
-                                and not file.endswith('-sources.jar')
-                                and not file.endswith('-javadoc.jar')):
-                            jars.append(os.path.join(root, file))
+                jars.extend(_walk_jars(search_path))
             else:
                 logger.warning("Maven path not found: %s", search_path)
         else:
             if not os.path.exists(self.m2_repo):
                 logger.warning("Maven repository not found: %s", self.m2_repo)
                 return jars
-            for root, _, files in os.walk(self.m2_repo):
-                for file in files:
-                    if file.endswith('.jar') and not file.endswith('-sources.jar'):
-                        jars.append(os.path.join(root, file))
+            jars.extend(_walk_jars(self.m2_repo))
 
         logger.info("Found %d JAR files", len(jars))
         return jars
 
+    @staticmethod
     def extract_from_jar(
-        self,
         jar_path: str,
         progress_callback: Optional[Callable[[int, int], None]] = None,
     ) -> Dict[str, dict]:
@@ -209,57 +331,63 @@ class MavenMetadataExtractor:
             progress_callback: Optional (current, total) callback for progress
 
         Returns:
-            Dict mapping fully-qualified class names to their metadata
+            Dict mapping fully-qualified class names to their metadata;
+            each method's 'parameters' is a tuple of (name, type) pairs
         """
-        if not _check_jawa():
-            logger.error("Cannot extract JAR metadata: jawa library not installed")
-            return {}
-
-        from jawa.cf import ClassFile
-        from jawa.util.descriptor import method_descriptor
-
         metadata: Dict[str, dict] = {}
+        source_jar = os.path.basename(jar_path)
+        # descriptor -> (parameters, return type). A JAR reuses a handful of
+        # signatures ("()V", "(Ljava/lang/String;)V"...) across thousands of
+        # methods, which then share one immutable tuple of (name, type) pairs.
+        signatures: Dict[str, Tuple[ParamPairs, str]] = {}
 
         try:
             with zipfile.ZipFile(jar_path, 'r') as jar:
-                class_files = [f for f in jar.filelist if f.filename.endswith('.class')]
-
-                for idx, file_info in enumerate(class_files):
+                infos = jar.infolist()
+                total = 0
+                if progress_callback:
+                    total = sum(1 for f in infos if f.filename.endswith('.class'))
+
+                idx = 0
+                for file_info in infos:
+                    if not file_info.filename.endswith('.class'):
+                        continue
                     if progress_callback:
-                        progress_callback(idx, len(class_files))
+                        progress_callback(idx, total)
+                    idx += 1
 
                     try:
-                        class_data = jar.read(file_info.filename)
-                        cf = ClassFile(io.BytesIO(class_data))
-                        class_name = cf.this.name.value.replace('/', '.')
+                        class_data = jar.read(file_info)
+                        cf = parse_class(class_data)
+                        class_name = cf['name'].replace('/', '.')
 
                         methods: Dict[str, dict] = {}
-                        for method in cf.methods:
-                            if method.name.value.startswith('<'):
+                        for method_name, descriptor, ann_types in cf['methods']:
+                            if method_name.startswith('<'):
                                 continue
 
                             annotations: List[str] = []
-                            for attr in method.attributes:
-                                if hasattr(attr, 'annotations'):
-                                    for ann in attr.annotations:
-                                        ann_name = _clean_annotation(str(ann.type.name.value))
-                                        annotations.append(ann_name)
+                            is_test = False
+                            for ann in ann_types:
+                                ann_name = sys.intern(_clean_annotation(ann))
+                                annotations.append(ann_name)
+                                # Exact match: @BeforeTest/@AfterTest are not tests
+                                if ann_name == 'Test':
+                                    is_test = True
 
                             try:
-                                desc = method_descriptor(method.descriptor.value)
-                                params = []
-                                for i, param_type in enumerate(desc.args):
-                                    param_type_str = _clean_jvm_type(param_type)
-                                    params.append({
-                                        'name': f'arg{i}',
-                                        'type': param_type_str,
-                                    })
-
-                                return_type = _clean_jvm_type(desc.returns)
-
-                                is_test = any('Test' in ann for ann in annotations)
-
-                                methods[method.name.value] = {
+                                signature = signatures.get(descriptor)
+                                if signature is None:
+                                    arg_types, returns = parse_method_descriptor(descriptor)
+                                    params = tuple(
+                                        (f'arg{i}', sys.intern(_clean_jvm_type(param_type)))
+                                        for i, param_type in enumerate(arg_types)
+                                    )
+                                    signature = signatures[descriptor] = (
+                                        params, sys.intern(_clean_jvm_type(returns)))
+                                params, return_type = signature
+
+                                methods[method_name] = {
                                     'parameters': params,
                                     'is_test': is_test,
                                     'return_type': return_type,
@@ -267,17 +395,19 @@ class MavenMetadataExtractor:
                                 }
                             except Exception:
                                 # Skip methods with unparseable descriptors
-                                methods[method.name.value] = {
-                                    'parameters': [],
+                                methods[method_name] = {
+                                    'parameters': (),
                                     'is_test': False,
                                     'return_type': 'unknown',
                                     'annotations': annotations,
                                 }
 
                         if methods:
+                            # Name order, so metadata (and saved JSON) is
+                            # already sorted for the reference listings
                             metadata[class_name] = {
-                                'methods': methods,
-                                'source_jar': os.path.basename(jar_path),
+                                'methods': dict(sorted(methods.items())),
+                                'source_jar': source_jar,
                             }
 
                     except Exception as e:
@@ -292,19 +422,86 @@ class MavenMetadataExtractor:
         logger.info("Extracted %d classes from %s", len(metadata), os.path.basename(jar_path))
         return metadata
 
+    @staticmethod
+    def extract_cached(
+        jar_path: str,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        cache_dir: Optional[str] = None,
+    ) -> Dict[str, dict]:
+        """
+        extract_from_jar() backed by an on-disk cache.
+
+        Each JAR's metadata is saved as JSON in cache_dir and reused while
+        the JAR's path, modification time and size are unchanged. A hit
+        refreshes the file's modification time, and the least recently
+        used files beyond JAR_CACHE_MAX_FILES are removed.
+
+        Args:
+            jar_path: Path to the JAR file
+            progress_callback: Optional (current, total) callback, only
+                               called when the JAR is actually extracted
+            cache_dir: Cache directory (default: JAR_CACHE_DIR)
+
+        Returns:
+            Dict mapping fully-qualified class names to their metadata
+        """
+        if cache_dir is None:
+            cache_dir = str(JAR_CACHE_DIR)
+        try:
+            name, key = _jar_cache_key(jar_path)
+        except OSError:
+            # Missing JAR: let extract_from_jar() report it
+            return MavenMetadataExtractor.extract_from_jar(jar_path, progress_callback)
+        cache_path = os.path.join(cache_dir, name)
+
+        metadata = _load_cached_jar(jar_path, cache_path, key)
+        if metadata is not None:
+            return metadata
+
+        metadata = MavenMetadataExtractor.extract_from_jar(jar_path, progress_callback)
+        if metadata:
+            # Write then rename, so parallel scans never read a partial file
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                save_json_file(tmp_path, {'key': key, 'metadata': metadata})
+                os.replace(tmp_path, cache_path)
+                _prune_jar_cache(cache_dir)
+            except Exception as e:
+                logger.debug("Could not cache metadata for %s: %s", jar_path, e)
+            finally:
+                if os.path.exists(tmp_path):
+                    try:
+                        os.remove(tmp_path)
+                    except OSError:
+                        pass
+        return metadata
+
     def scan_project_jars(
         self,
         group_ids: List[str],
         artifact_ids: List[str],
         progress_callback: Optional[Callable[[int, int], None]] = None,
+        max_workers: Optional[int] = None,
+        use_cache: bool = True,
+        mp_context=None,
     ) -> Dict[str, dict]:
         """
         Scan Maven repository for project JARs and extract metadata.
 
+        Cached JARs are read in this process. The rest are spread over
+        worker processes when there are at least PARALLEL_MIN_JARS of them.
+
         Args:
             group_ids: List of Maven group IDs
             artifact_ids: List of Maven artifact IDs
-            progress_callback: Optional progress callback
+            progress_callback: Optional progress callback (per class when
+                               extracting sequentially, per JAR in parallel)
+            max_workers: Worker processes for multi-JAR scans
+                         (default: CPU count, 1 = sequential)
+            use_cache: Reuse cached metadata for unchanged JARs
+            mp_context: multiprocessing context for the workers (the GUI
+                        passes "spawn" rather than fork its Tk process)
 
         Returns:
             Combined metadata dict from all JARs
@@ -320,12 +517,40 @@ class MavenMetadataExtractor:
             return {}
 
         logger.info("Processing %d JAR files...", len(all_jars))
+        extract = (MavenMetadataExtractor.extract_cached if use_cache
+                   else MavenMetadataExtractor.extract_from_jar)
+
+        jar_metadata: Dict[str, Dict[str, dict]] = {}
+        pending = all_jars
+        if use_cache:
+            pending = []
+            for jar in all_jars:
+                cached = _cached_jar_metadata(jar)
+                if cached is None:
+                    pending.append(jar)
+                else:
+                    jar_metadata[jar] = cached
+
+        workers = max_workers or os.cpu_count() or 1
+        if len(pending) >= PARALLEL_MIN_JARS and workers > 1:
+            # JARs are parsed independently, so spread them over processes;
+            # progress is then reported per JAR rather than per class
+            with ProcessPoolExecutor(max_workers=min(workers, len(pending)),
+                                     mp_context=mp_context) as executor:
+                for idx, (jar, metadata) in enumerate(zip(pending, executor.map(extract, pending))):
+                    jar_metadata[jar] = metadata
+                    if progress_callback:
+                        progress_callback(idx + 1, len(pending))
+        else:
+            for jar in pending:
+                jar_metadata[jar] = extract(jar, progress_callback)
 
+        # Merge in scan order, so a later JAR's class wins as before
         for idx, jar in enumerate(all_jars):
-            jar_metadata = self.extract_from_jar(jar, progress_callback)
-            self.metadata.update(jar_metadata)
+            metadata = jar_metadata[jar]
+            self.metadata.update(metadata)
             logger.info("[%d/%d] Extracted %d classes from %s",
-                       idx + 1, len(all_jars), len(jar_metadata), os.path.basename(jar))
+                        idx + 1, len(all_jars), len(metadata), os.path.basename(jar))
 
         logger.info("Total: Extracted metadata for %d classes", len(self.metadata))
         return self.metadata
@@ -333,8 +558,9 @@ class MavenMetadataExtractor:
     def save_metadata(self, output_path: str) -> None:
         """Save extracted metadata to a JSON file."""
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(self.metadata, f, indent=2)
+            # Compact output: metadata is machine-read and can run to
+            # tens of MB for a full .m2 scan
+            save_json_file(output_path, _json_metadata(self.metadata))
             logger.info("Metadata saved to: %s", output_path)
         except Exception as e:
             logger.error("Failed to save metadata: %s", e)
@@ -342,8 +568,7 @@ class MavenMetadataExtractor:
     def load_metadata(self, input_path: str) -> Dict[str, dict]:
         """Load metadata from a JSON file."""
         try:
-            with open(input_path, 'r', encoding='utf-8') as f:
-                self.metadata = json.load(f)
+            self.metadata = intern_json_strings(load_json_file(input_path))
             logger.info("Loaded metadata for %d classes from %s", len(self.metadata), input_path)
             return self.metadata
         except Exception as e:
@@ -4,11 +4,17 @@ Data models for the TestNG Validator.
 Defines all core data structures used across the application.
 """
 
+import sys
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, FrozenSet, Tuple
 from enum import Enum
 from datetime import datetime
 
+# Slotted dataclasses (no per-instance __dict__) where supported; a run can
+# hold tens of thousands of ValidationError objects. Python < 3.10 falls
+# back to regular dataclasses.
+_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class Severity(Enum):
     """Validation error severity levels."""
@@ -20,7 +26,7 @@ class Severity(Enum):
         return self.value
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ValidationError:
     """
     Represents a single validation finding.
@@ -66,7 +72,7 @@ class ValidationError:
         return "Unknown"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ValidationResult:
     """
     Aggregated result of validating a single file.
@@ -85,18 +91,66 @@ class ValidationResult:
     duration_ms: float = 0.0
     file_size: int = 0
     metadata_used: bool = False
+    # (errors list, errors, warnings, infos) from the last count
+    _counts: Optional[Tuple[list, int, int, int]] = field(
+        default=None, init=False, repr=False, compare=False)
+    # (errors list, codes) from the last code_set build
+    _codes: Optional[Tuple[list, FrozenSet[str]]] = field(
+        default=None, init=False, repr=False, compare=False)
+
+    # The counts and code_set are cached. They are dropped by add_error()
+    # and extend_errors(), and rebuilt when errors is assigned a new list;
+    # editing the list in place is not tracked.
+
+    def _severity_counts(self) -> Tuple[list, int, int, int]:
+        """Count all three severities in one pass, cached until errors change."""
+        errors = self.errors
+        counts = self._counts
+        if counts is None or counts[0] is not errors:
+            n_err = n_warn = n_info = 0
+            for e in errors:
+                sev = e.severity
+                if sev is Severity.ERROR:
+                    n_err += 1
+                elif sev is Severity.WARNING:
+                    n_warn += 1
+                elif sev is Severity.INFO:
+                    n_info += 1
+            counts = self._counts = (errors, n_err, n_warn, n_info)
+        return counts
+
+    def add_error(self, error: ValidationError) -> None:
+        """Append a finding and invalidate the cached counts and codes."""
+        self.errors.append(error)
+        self._counts = None
+        self._codes = None
+
+    def extend_errors(self, errors: List[ValidationError]) -> None:
+        """Append several findings and invalidate the cached counts and codes."""
+        self.errors.extend(errors)
+        self._counts = None
+        self._codes = None
+
+    @property
+    def code_set(self) -> FrozenSet[str]:
+        """Distinct error codes, cached until errors change."""
+        errors = self.errors
+        codes = self._codes
+        if codes is None or codes[0] is not errors:
+            codes = self._codes = (errors, frozenset(e.code for e in errors))
+        return codes[1]
 
     @property
     def error_count(self) -> int:
-        return sum(1 for e in self.errors if e.severity == Severity.ERROR)
+        return self._severity_counts()[1]
 
     @property
     def warning_count(self) -> int:
-        return sum(1 for e in self.errors if e.severity == Severity.WARNING)
+        return self._severity_counts()[2]
 
     @property
     def info_count(self) -> int:
-        return sum(1 for e in self.errors if e.severity == Severity.INFO)
+        return self._severity_counts()[3]
 
     @property
     def is_valid(self) -> bool:
@@ -146,7 +200,7 @@ class ValidationResult:
         return grouped
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class FixSuggestion:
     """
     Tutorial-style fix suggestion for a validation error.
@@ -163,7 +217,7 @@ class FixSuggestion:
     context: str = ""
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class FileEntry:
     """
     Tracks a file loaded into the application.
@@ -195,7 +249,7 @@ class FileEntry:
         return os.path.basename(self.path)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class MavenCoordinates:
     """Maven artifact coordinates."""
     group_id: str
@@ -209,7 +263,7 @@ class MavenCoordinates:
         return ":".join(parts)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ClassMetadata:
     """Metadata for a Java class extracted from a JAR."""
     class_name: str
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+All JAR-dependent tests in one process.
+
+    python -m unittest OPUS.tests.maven_suite -v
+
+Each module skips itself when the JAR is not on disk.
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from OPUS.tests import smoke_maven, smoke_maven_semantic, test_maven_live
+
+MAVEN_TEST_MODULES = (test_maven_live, smoke_maven, smoke_maven_semantic)
+
+
+def load_tests(loader, tests, pattern):
+    """unittest hook: aggregate the JAR-dependent modules."""
+    suite = unittest.TestSuite()
+    for module in MAVEN_TEST_MODULES:
+        suite.addTests(loader.loadTestsFromModule(module))
+    return suite
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
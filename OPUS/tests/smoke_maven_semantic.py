@@ -11,65 +11,24 @@ JAR facts (verified):
   - NxtGenBgpRouteOutDetail.getBgpRouteOutDetailTable has 3 params
   - NxtGenBgpRouteOutDetail.saveBgpRouteOutDetailTableAttribute has 5 params
 """
-import logging, sys, os, tempfile
-logging.basicConfig(level=logging.WARNING, format="%(message)s")
+import os
+import sys
+import unittest
+
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-import OPUS.maven.extractor as ext_mod
-ext_mod._jawa_available = None
 from OPUS.maven.extractor import MavenMetadataExtractor
-from OPUS.validators import validate_file
+from OPUS.validators import validate_string
 
 JAR = r"C:\Users\schavan\.m2\repository\com\eci\raft\tests\NxtGenNPTCliApi\10.2.13\NxtGenNPTCliApi-10.2.13.jar"
 
-ext = MavenMetadataExtractor()
-metadata = ext.extract_from_jar(JAR)
-print(f"Metadata: {len(metadata)} classes\n")
-
-
-def validate_xml_string(xml, label):
-    """Write XML to temp file, validate, print results."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".xml", delete=False, encoding="utf-8") as f:
-        f.write(xml)
-        tmp = f.name
-    try:
-        result = validate_file(tmp, metadata=metadata)
-        codes = [e.code for e in result.errors]
-        print(f"--- {label} ---")
-        if result.errors:
-            for e in result.errors:
-                line_str = str(e.line or "?").rjust(3)
-                print(f"  L{line_str} [{e.code}] {e.message}")
-                if e.suggestion:
-                    print(f"        >> {e.suggestion}")
-        else:
-            print("  (no errors)")
-        print()
-        return codes
-    finally:
-        os.unlink(tmp)
-
-
-passed = 0
-failed = 0
+# (label, xml, expected codes, codes that must not appear)
+CASES = []
+
 
 def check(label, xml, expected_codes, not_expected=None):
-    global passed, failed
-    codes = validate_xml_string(xml, label)
-    ok = True
-    for ec in expected_codes:
-        if ec not in codes:
-            print(f"  ** FAIL: Expected {ec} not found!")
-            ok = False
-    if not_expected:
-        for nec in not_expected:
-            if nec in codes:
-                print(f"  ** FAIL: Unexpected {nec} found!")
-                ok = False
-    if ok:
-        passed += 1
-    else:
-        failed += 1
+    """Register one isolated semantic check."""
+    CASES.append((label, xml, expected_codes, not_expected or []))
 
 
 # ===== TEST 1: E300 - Class missing 'operation' in package =====
@@ -199,7 +158,31 @@ check("VALID: commans.timeutils.TimeApi exists in JAR", '''<?xml version="1.0"?>
   </class>
 </classes></test></suite>''', [], not_expected=["E300"])
 
-# ===== SUMMARY =====
-print("=" * 60)
-print(f"RESULTS: {passed} passed, {failed} failed out of {passed + failed}")
-print("=" * 60)
+
+metadata = {}
+
+
+def setUpModule():
+    """Load the JAR metadata once for every check."""
+    global metadata
+    if os.path.exists(JAR):
+        # Cached per JAR mtime/size, so repeat runs skip re-extraction
+        metadata = MavenMetadataExtractor.extract_cached(JAR)
+
+
+@unittest.skipUnless(os.path.exists(JAR), f"JAR not found: {JAR}")
+class TestMavenSemantic(unittest.TestCase):
+    """Each intentional error from the sample suite, validated in isolation."""
+
+    def test_checks(self):
+        for label, xml, expected_codes, not_expected in CASES:
+            with self.subTest(label):
+                codes = {e.code for e in validate_string(xml, metadata=metadata).errors}
+                for ec in expected_codes:
+                    self.assertIn(ec, codes, f"Expected {ec} not found")
+                for nec in not_expected:
+                    self.assertNotIn(nec, codes, f"Unexpected {nec} found")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Tests for the report exporters.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from OPUS.exporters import export_html, export_json
+from OPUS.models import Severity, ValidationError, ValidationResult
+
+
+def _results():
+    return [
+        ValidationResult(file_path="/suites/a.xml", duration_ms=1.5, errors=[
+            ValidationError(code="E101", message="Suite missing 'name'", line=1, col=0),
+            ValidationError(code="E170", message="Space in class name\n'a b'", line=3, col=4,
+                            severity=Severity.WARNING, context_data="a b"),
+        ]),
+        ValidationResult(file_path="/suites/b.xml", duration_ms=0.5),
+    ]
+
+
+class TestExporters(unittest.TestCase):
+    """Test the file-at-a-time HTML and JSON writers."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+
+    def _export(self, func, name, results):
+        path = os.path.join(self._tmp.name, name)
+        self.assertTrue(func(results, path))
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+
+    def test_json_layout_matches_json_dump(self):
+        for results in (_results(), []):
+            with self.subTest(files=len(results)):
+                text = self._export(export_json, "report.json", results)
+                report = json.loads(text)
+                self.assertEqual(text, json.dumps(report, indent=2, ensure_ascii=False))
+                self.assertEqual(len(report["files"]), len(results))
+
+        report = json.loads(self._export(export_json, "report.json", _results()))
+        self.assertEqual(report["summary"]["total_errors"], 1)
+        first = report["files"][0]
+        self.assertEqual([e["code"] for e in first["errors"]], ["E101", "E170"])
+        self.assertEqual(first["errors"][1]["message"], "Space in class name\n'a b'")
+
+    def test_html_sections(self):
+        html = self._export(export_html, "report.html", _results())
+        self.assertEqual(html.count("<tr><td>"), 2)
+        self.assertIn('<div class="errors-section"><h3>a.xml</h3>', html)
+        self.assertNotIn("<h3>b.xml</h3>", html)
+        self.assertIn("[E170] Line 3:", html)
+        self.assertTrue(html.rstrip().endswith("</html>"))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
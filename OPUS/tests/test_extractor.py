@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+Tests for the Maven extractor: JVM type helpers and the class file reader.
+Class files and JARs are assembled in memory, so no JDK is needed.
+"""
+
+import os
+import struct
+import sys
+import tempfile
+import unittest
+import zipfile
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from OPUS.maven.classfile import parse_class, parse_method_descriptor
+from OPUS.maven.extractor import (
+    MavenMetadataExtractor, _clean_jvm_type, _clean_annotation, _prune_jar_cache,
+)
+from OPUS.config import PARALLEL_MIN_JARS
+from OPUS.utils.file_utils import load_json_file
+
+
+def _build_class(name, methods):
+    """
+    Assemble a minimal class file.
+
+    methods is a list of (name, descriptor, annotation descriptors); each
+    method also gets a dummy Code attribute, and each annotation carries
+    array, enum and nested-annotation element values to be skipped.
+    """
+    pool = []
+    index = {}
+
+    def utf8(text):
+        if ("utf8", text) not in index:
+            data = text.encode("utf-8")
+            pool.append(struct.pack(">BH", 1, len(data)) + data)
+            index[("utf8", text)] = len(pool)
+        return index[("utf8", text)]
+
+    def klass(text):
+        name_index = utf8(text)
+        pool.append(struct.pack(">BH", 7, name_index))
+        return len(pool)
+
+    this_class = klass(name)
+    super_class = klass("java/lang/Object")
+    # A Long constant takes two pool slots
+    pool.append(struct.pack(">Bq", 5, 42))
+    pool.append(b"")
+
+    def annotation(desc):
+        return (struct.pack(">HH", utf8(desc), 3)
+                + struct.pack(">H", utf8("groups")) + b"[" + struct.pack(">H", 1)
+                + b"s" + struct.pack(">H", utf8("smoke"))
+                + struct.pack(">H", utf8("mode")) + b"e" + struct.pack(">HH", utf8("LMode;"), utf8("FAST"))
+                + struct.pack(">H", utf8("nested")) + b"@" + struct.pack(">HH", utf8("LInner;"), 0))
+
+    body = b""
+    for method_name, desc, anns in methods:
+        attrs = [struct.pack(">HI", utf8("Code"), 4) + b"\x00\x01\x02\x03"]
+        if anns:
+            data = struct.pack(">H", len(anns)) + b"".join(annotation(a) for a in anns)
+            attrs.append(struct.pack(">HI", utf8("RuntimeVisibleAnnotations"), len(data)) + data)
+        body += struct.pack(">HHHH", 1, utf8(method_name), utf8(desc), len(attrs)) + b"".join(attrs)
+
+    field = struct.pack(">HHHH", 2, utf8("count"), utf8("I"), 0)
+    cp = b"".join(pool)
+    return (struct.pack(">IHHH", 0xCAFEBABE, 0, 52, len(pool) + 1) + cp
+            + struct.pack(">HHHH", 0x21, this_class, super_class, 0)
+            + struct.pack(">H", 1) + field
+            + struct.pack(">H", len(methods)) + body
+            + struct.pack(">H", 0))
+
+
+class _FakeJVMType:
+    """Stand-in for a jawa JVMType object."""
+
+    def __init__(self, name, dimensions):
+        self.name = name
+        self.dimensions = dimensions
+
+
+class TestCleanJvmType(unittest.TestCase):
+    """Test JVM type descriptor cleanup."""
+
+    def test_primitives(self):
+        self.assertEqual(_clean_jvm_type("I"), "int")
+        self.assertEqual(_clean_jvm_type("Z"), "boolean")
+
+    def test_object_reference(self):
+        self.assertEqual(_clean_jvm_type("Ljava/lang/String;"), "String")
+        self.assertEqual(_clean_jvm_type("Lcom/example/Foo;"), "Foo")
+
+    def test_arrays(self):
+        self.assertEqual(_clean_jvm_type("[I"), "int[]")
+        self.assertEqual(_clean_jvm_type("[[Ljava/lang/String;"), "String[][]")
+
+    def test_jvmtype_repr_and_object(self):
+        text = "JVMType(base_type='L', dimensions=1, name='java/util/Map')"
+        self.assertEqual(_clean_jvm_type(text), "Map[]")
+        self.assertEqual(_clean_jvm_type(_FakeJVMType("I", 2)), "int[][]")
+        self.assertEqual(_clean_jvm_type(_FakeJVMType("com/example/Bar", 0)), "Bar")
+
+    def test_empty_values(self):
+        self.assertEqual(_clean_jvm_type(None), "unknown")
+        self.assertEqual(_clean_jvm_type("  "), "unknown")
+
+
+class TestCleanAnnotation(unittest.TestCase):
+    """Test annotation descriptor cleanup."""
+
+    def test_descriptor(self):
+        self.assertEqual(_clean_annotation("Lorg/testng/annotations/Test;"), "Test")
+
+    def test_jvmtype_repr(self):
+        text = "JVMType(base_type='L', dimensions=0, name='org/testng/annotations/BeforeClass')"
+        self.assertEqual(_clean_annotation(text), "BeforeClass")
+
+
+class TestClassFile(unittest.TestCase):
+    """Test the minimal class file reader."""
+
+    def test_parse_class(self):
+        data = _build_class("com/example/LoginTest", [
+            ("<init>", "()V", []),
+            ("testLogin", "(Ljava/lang/String;[I)V", ["Lorg/testng/annotations/Test;"]),
+        ])
+        cf = parse_class(data)
+        self.assertEqual(cf["name"], "com/example/LoginTest")
+        self.assertEqual(cf["methods"], [
+            ("<init>", "()V", []),
+            ("testLogin", "(Ljava/lang/String;[I)V", ["Lorg/testng/annotations/Test;"]),
+        ])
+
+    def test_bad_input(self):
+        with self.assertRaises(ValueError):
+            parse_class(b"not a class file")
+        data = _build_class("Foo", [("run", "()V", [])])
+        with self.assertRaises(ValueError):
+            parse_class(data[:-10])
+
+    def test_method_descriptor(self):
+        self.assertEqual(parse_method_descriptor("(IJ[[Ljava/lang/String;Z)V"),
+                         (["I", "J", "[[Ljava/lang/String;", "Z"], "V"))
+        self.assertEqual(parse_method_descriptor("()Ljava/util/List;"), ([], "Ljava/util/List;"))
+        for bad in ("V", "(I", "(Q)V", "(Ljava/lang/String)V"):
+            with self.assertRaises(ValueError):
+                parse_method_descriptor(bad)
+
+    def test_extract_from_jar(self):
+        data = _build_class("com/example/LoginTest", [
+            ("<init>", "()V", []),
+            ("testLogin", "(Ljava/lang/String;I)V", ["Lorg/testng/annotations/Test;"]),
+            ("helper", "()[Ljava/lang/String;", []),
+            ("setUp", "()V", ["Lorg/testng/annotations/BeforeTest;"]),
+        ])
+        with tempfile.TemporaryDirectory() as tmp:
+            jar = os.path.join(tmp, "tests.jar")
+            with zipfile.ZipFile(jar, "w") as zf:
+                zf.writestr("META-INF/MANIFEST.MF", "Manifest-Version: 1.0\n")
+                zf.writestr("com/example/LoginTest.class", data)
+                zf.writestr("com/example/Broken.class", b"\xca\xfe")
+            metadata = MavenMetadataExtractor.extract_from_jar(jar)
+
+        self.assertEqual(list(metadata), ["com.example.LoginTest"])
+        cls = metadata["com.example.LoginTest"]
+        self.assertEqual(cls["source_jar"], "tests.jar")
+        self.assertEqual(list(cls["methods"]), ["helper", "setUp", "testLogin"])
+        self.assertEqual(cls["methods"]["testLogin"], {
+            "parameters": (("arg0", "String"), ("arg1", "int")),
+            "is_test": True,
+            "return_type": "void",
+            "annotations": ["Test"],
+        })
+        self.assertEqual(cls["methods"]["helper"]["return_type"], "String[]")
+        self.assertFalse(cls["methods"]["helper"]["is_test"])
+        self.assertEqual(cls["methods"]["setUp"]["annotations"], ["BeforeTest"])
+        self.assertFalse(cls["methods"]["setUp"]["is_test"])
+
+    def test_save_metadata_writes_parameter_dicts(self):
+        ext = MavenMetadataExtractor()
+        ext.metadata = {"a.A": {"source_jar": "a.jar", "methods": {
+            "run": {"parameters": (("arg0", "String"),), "is_test": True},
+            "loaded": {"parameters": [{"name": "user", "type": "String"}]},
+        }}}
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "meta.json")
+            ext.save_metadata(path)
+            saved = load_json_file(path)
+        methods = saved["a.A"]["methods"]
+        self.assertEqual(methods["run"], {"parameters": [{"name": "arg0", "type": "String"}],
+                                          "is_test": True})
+        self.assertEqual(methods["loaded"]["parameters"], [{"name": "user", "type": "String"}])
+        self.assertEqual(saved["a.A"]["source_jar"], "a.jar")
+        # The in-memory metadata keeps its tuples
+        self.assertEqual(ext.metadata["a.A"]["methods"]["run"]["parameters"], (("arg0", "String"),))
+
+
+class TestJarCache(unittest.TestCase):
+    """Test the mtime/size-keyed metadata cache."""
+
+    def test_extract_cached(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            jar = os.path.join(tmp, "tests.jar")
+            cache_dir = os.path.join(tmp, "cache")
+            with zipfile.ZipFile(jar, "w") as zf:
+                zf.writestr("a/A.class", _build_class("a/A", [("run", "()V", [])]))
+
+            first = MavenMetadataExtractor.extract_cached(jar, cache_dir=cache_dir)
+            self.assertEqual(list(first), ["a.A"])
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+            self.assertEqual(MavenMetadataExtractor.extract_cached(jar, cache_dir=cache_dir), first)
+
+            # A rebuilt JAR (new size/mtime) is extracted again
+            with zipfile.ZipFile(jar, "w") as zf:
+                zf.writestr("b/B.class", _build_class("b/B", [("run", "()V", [])]))
+                zf.writestr("b/C.class", _build_class("b/C", [("run", "()V", [])]))
+            second = MavenMetadataExtractor.extract_cached(jar, cache_dir=cache_dir)
+            self.assertEqual(sorted(second), ["b.B", "b.C"])
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+    def test_cache_is_json_with_parameter_pairs(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            jar = os.path.join(tmp, "tests.jar")
+            cache_dir = os.path.join(tmp, "cache")
+            with zipfile.ZipFile(jar, "w") as zf:
+                zf.writestr("a/A.class", _build_class("a/A", [
+                    ("one", "(Ljava/lang/String;I)V", []),
+                    ("two", "(Ljava/lang/String;I)V", []),
+                ]))
+            extracted = MavenMetadataExtractor.extract_cached(jar, cache_dir=cache_dir)
+            (name,) = os.listdir(cache_dir)
+            self.assertTrue(name.endswith(".json"))
+            self.assertIn("metadata", load_json_file(os.path.join(cache_dir, name)))
+
+            cached = MavenMetadataExtractor.extract_cached(jar, cache_dir=cache_dir)
+            self.assertEqual(cached, extracted)
+            methods = cached["a.A"]["methods"]
+            self.assertEqual(methods["one"]["parameters"], (("arg0", "String"), ("arg1", "int")))
+            self.assertIs(methods["one"]["parameters"], methods["two"]["parameters"])
+
+    def test_failed_cache_write_leaves_no_temp_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            jar = os.path.join(tmp, "tests.jar")
+            cache_dir = os.path.join(tmp, "cache")
+            with zipfile.ZipFile(jar, "w") as zf:
+                zf.writestr("a/A.class", _build_class("a/A", [("run", "()V", [])]))
+            with mock.patch("OPUS.maven.extractor.os.replace", side_effect=ValueError("boom")):
+                metadata = MavenMetadataExtractor.extract_cached(jar, cache_dir=cache_dir)
+            self.assertEqual(list(metadata), ["a.A"])
+            self.assertEqual(os.listdir(cache_dir), [])
+
+    def test_prune_removes_least_recently_used(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            for i in range(4):
+                path = os.path.join(cache_dir, f"{i}.json")
+                open(path, "w").close()
+                os.utime(path, (i, i))
+            _prune_jar_cache(cache_dir, max_files=2)
+            self.assertEqual(sorted(os.listdir(cache_dir)), ["2.json", "3.json"])
+
+
+class TestScanProjectJars(unittest.TestCase):
+    """Test when a multi-JAR scan starts worker processes."""
+
+    def _add_artifact(self, repo, artifact, count):
+        version_dir = os.path.join(repo, "com", "example", artifact, "1.0")
+        os.makedirs(version_dir)
+        for i in range(count):
+            with zipfile.ZipFile(os.path.join(version_dir, f"{artifact}-{i}.jar"), "w") as zf:
+                zf.writestr(f"{artifact}/A{i}.class",
+                            _build_class(f"{artifact}/A{i}", [("run", "()V", [])]))
+
+    def test_small_or_cached_scans_stay_in_process(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = os.path.join(tmp, "repo")
+            self._add_artifact(repo, "small", PARALLEL_MIN_JARS - 1)
+            self._add_artifact(repo, "large", PARALLEL_MIN_JARS)
+            no_pool = mock.patch("OPUS.maven.extractor.ProcessPoolExecutor",
+                                 side_effect=AssertionError("pool started"))
+            with mock.patch("OPUS.maven.extractor.JAR_CACHE_DIR", os.path.join(tmp, "cache")):
+                with no_pool:
+                    small = MavenMetadataExtractor(repo).scan_project_jars(["com.example"], ["small"])
+                self.assertEqual(len(small), PARALLEL_MIN_JARS - 1)
+                # Enough uncached JARs: extracted by worker processes
+                first = MavenMetadataExtractor(repo).scan_project_jars(["com.example"], ["large"])
+                self.assertEqual(sorted(first), [f"large.A{i}" for i in range(PARALLEL_MIN_JARS)])
+                # Every JAR now a cache hit: no pool
+                with no_pool:
+                    again = MavenMetadataExtractor(repo).scan_project_jars(["com.example"], ["large"])
+                self.assertEqual(again, first)
+
+
+class TestFindJars(unittest.TestCase):
+    """Test JAR discovery in a Maven repository layout."""
+
+    def test_find_jars(self):
+        with tempfile.TemporaryDirectory() as repo:
+            version_dir = os.path.join(repo, "com", "example", "suite", "1.0")
+            os.makedirs(version_dir)
+            for name in ("suite-1.0.jar", "suite-1.0-sources.jar",
+                         "suite-1.0-javadoc.jar", "suite-1.0.pom"):
+                open(os.path.join(version_dir, name), "w").close()
+            ext = MavenMetadataExtractor(repo)
+            expected = [os.path.join(version_dir, "suite-1.0.jar")]
+            self.assertEqual(ext.find_jars("com.example", "suite"), expected)
+            self.assertEqual(ext.find_jars(), expected)
+            self.assertEqual(ext.find_jars("com.example", "missing"), [])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -3,46 +3,53 @@
 Tests for fix generation and auto-fix engine.
 """
 
+import gc
 import os
+import shutil
 import sys
 import tempfile
 import unittest
+import weakref
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from OPUS.models import ValidationError, Severity
 from OPUS.fixes.fix_generator import generate_fix
 from OPUS.fixes.auto_fixer import apply_auto_fix, batch_auto_fix
+from OPUS.fixes import knowledge_base
 from OPUS.config import CODE_META
 
+# Severity each registered code is reported with (anything but ERROR -> WARNING)
+_SEVERITY_BY_CODE = {
+    code: Severity.ERROR if meta[1] == "ERROR" else Severity.WARNING
+    for code, meta in CODE_META.items()
+}
+
+
+def _err(code, message, **overrides):
+    """ValidationError on line 1 with ERROR severity unless overridden."""
+    fields = {"line": 1, "severity": Severity.ERROR}
+    fields.update(overrides)
+    return ValidationError(code=code, message=message, **fields)
+
 
 class TestFixGenerator(unittest.TestCase):
     """Test tutorial-style fix generation."""
 
     def _make_error(self, code, message="test", line=1, ctx=None, line_content=None):
-        meta = CODE_META.get(code, (message, "ERROR"))
-        return ValidationError(
-            code=code, message=message, line=line,
-            severity=Severity.ERROR if meta[1] == "ERROR" else Severity.WARNING,
-            context_data=ctx, line_content=line_content,
-        )
+        return _err(code, message, line=line,
+                    severity=_SEVERITY_BY_CODE.get(code, Severity.ERROR),
+                    context_data=ctx, line_content=line_content)
 
     def test_fix_for_every_registered_code(self):
         """Every code in CODE_META should produce a non-default fix."""
-        test_codes = [
-            "E100", "E101", "E102", "E103", "E104", "E105", "E106",
-            "E107", "E108", "E109", "E110", "E111", "E112", "E113",
-            "E114", "E115", "E116", "E117", "E120", "E121", "E122",
-            "E123", "E124", "E130", "E131", "E132", "E145", "E160",
-            "E161", "E170", "E180", "E181", "E182", "E200", "E201",
-            "E300", "E301", "E303", "E310",
-        ]
-        for code in test_codes:
-            err = self._make_error(code, ctx="test_ctx", line_content='<test name="x"/>')
-            fix = generate_fix(err)
-            self.assertIsNotNone(fix, f"No fix for {code}")
-            self.assertTrue(len(fix.steps) > 0, f"Empty steps for {code}")
-            self.assertTrue(len(fix.title) > 0, f"Empty title for {code}")
+        for code in CODE_META:
+            with self.subTest(code=code):
+                err = self._make_error(code, ctx="test_ctx", line_content='<test name="x"/>')
+                fix = generate_fix(err)
+                self.assertIsNotNone(fix, f"No fix for {code}")
+                self.assertTrue(len(fix.steps) > 0, f"Empty steps for {code}")
+                self.assertTrue(len(fix.title) > 0, f"Empty title for {code}")
 
     def test_fix_e170_has_clean_name(self):
         err = self._make_error("E170", ctx="Test Class", line_content='<class name="Test Class"/>')
@@ -66,52 +73,193 @@ class TestFixGenerator(unittest.TestCase):
         self.assertIn("End of File", fix.steps[0])
 
 
+class TestKnowledgeBase(unittest.TestCase):
+    """Test knowledge base lookups."""
+
+    def test_known_code_has_entry(self):
+        kb = knowledge_base.get_knowledge("E101")
+        self.assertIn("name attribute", kb.explain)
+        self.assertTrue(kb.mistakes)
+
+    def test_unknown_code_returns_default(self):
+        kb = knowledge_base.get_knowledge("E999")
+        self.assertIn("Quick Fix", kb.explain)
+        self.assertEqual(kb.sample, "")
+
+    def test_mapping_view(self):
+        kb = knowledge_base.KNOWLEDGE_BASE
+        self.assertIn("E100", kb)
+        self.assertNotIn("E999", kb)
+        self.assertEqual(len(kb), len(list(kb)))
+        self.assertEqual(kb["E100"], knowledge_base.get_knowledge("E100"))
+
+    def test_lookup_loads_only_its_family(self):
+        view = knowledge_base._KBView()
+        self.assertIn("thread-count", view["E181"].explain)
+        self.assertEqual(list(view._loaded), ["kb_attributes"])
+        self.assertNotIn("E100", view._entries)
+
+    def test_render_mistakes(self):
+        text = knowledge_base.render_mistakes("E103")
+        self.assertEqual(text.count("\u2022"), len(knowledge_base.get_knowledge("E103").mistakes))
+        self.assertTrue(text.endswith("\n"))
+        self.assertEqual(knowledge_base.render_mistakes("E999"), "")
+
+    def test_codes_with_prefix(self):
+        self.assertEqual(knowledge_base.codes_with_prefix("E18"),
+                         ["E180", "E181", "E182", "E183", "E184", "E185"])
+        self.assertEqual(knowledge_base.codes_with_prefix("E9"), [])
+        self.assertEqual(len(knowledge_base.codes_with_prefix("")),
+                         len(knowledge_base.KNOWLEDGE_BASE))
+
+    def test_safe_type_strips_jvm_artifacts(self):
+        self.assertEqual(knowledge_base._safe_type("Ljava/lang/String;"), "String")
+        self.assertEqual(knowledge_base._safe_type("JVMType(name='java/util/Map')"), "Map")
+        self.assertEqual(knowledge_base._safe_type("Z"), "boolean")
+        self.assertEqual(knowledge_base._safe_type(""), "text")
+        self.assertEqual(knowledge_base._default_for_type("java.lang.Integer"), "0")
+        self.assertEqual(knowledge_base._default_for_type("Lcom/example/Foo;"), "value")
+
+    def test_class_reference_lists_methods(self):
+        metadata = {"com.example.LoginTest": {"source_jar": "app.jar", "methods": {
+            "testLogin": {"is_test": True, "annotations": ["Test"],
+                          "parameters": [{"name": "user", "type": "Ljava/lang/String;"}]},
+            "setUp": {"parameters": []},
+            "lambda$0": {},
+        }}}
+        ref = knowledge_base.get_class_reference("com.example.LoginTest", metadata)
+        self.assertIn("Total methods: 2", ref)
+        self.assertIn("  testLogin\n    Parameters: user (String)  [@Test]\n", ref)
+        self.assertIn("  setUp  (no parameters)\n", ref)
+        self.assertNotIn("lambda$0", ref)
+        self.assertIsNone(knowledge_base.get_class_reference("com.example.Other", metadata))
+
+    def test_references_accept_extracted_parameter_pairs(self):
+        def make(params):
+            return {"com.example.A": {"methods": {"testRun": {"is_test": True, "parameters": params}}}}
+        pairs = make((("arg0", "String"), ("arg1", "int")))
+        lists = make([["arg0", "String"], ["arg1", "int"]])  # pairs after json.dump/load
+        dicts = make([{"name": "arg0", "type": "String"}, {"name": "arg1", "type": "int"}])
+        for func, args in ((knowledge_base.get_class_reference, ("com.example.A",)),
+                           (knowledge_base.get_method_reference, ("com.example.A", "testRun")),
+                           (knowledge_base.get_missing_params_info, ("com.example.A", "testRun", 1))):
+            for form, metadata in (("tuple", pairs), ("list", lists)):
+                with self.subTest(func=func.__name__, form=form):
+                    self.assertEqual(func(*args, metadata), func(*args, dicts))
+        self.assertIn("Parameters: arg0 (String), arg1 (int)",
+                      knowledge_base.get_class_reference("com.example.A", pairs))
+
+    def test_class_reference_sorts_methods_without_touching_metadata(self):
+        def make():
+            return {"com.example.A": {"methods": {
+                "testB": {"is_test": True}, "helper": {}, "ajc$x": {}, "testA": {"is_test": True},
+            }}}
+        metadata = make()
+        ref = knowledge_base.get_class_reference("com.example.A", metadata)
+        self.assertIn("Test Methods (usable in <include>):\n" + "-" * 50 +
+                      "\n  testA  (no parameters)\n\n  testB  (no parameters)\n", ref)
+        self.assertNotIn("ajc$x", ref)
+        self.assertEqual(metadata, make())
+
+    def test_reference_cache_follows_metadata_object(self):
+        metadata = {"com.example.A": {"methods": {"t": {"is_test": True}}}}
+        first = knowledge_base.get_class_reference("com.example.A", metadata)
+        self.assertIs(knowledge_base.get_class_reference("com.example.A", metadata), first)
+        other = {"com.example.A": {"methods": {}}}
+        self.assertIn("Total methods: 0", knowledge_base.get_class_reference("com.example.A", other))
+        # Classes added to the same dict start a fresh cache
+        other["com.example.C"] = {"methods": {}}
+        self.assertIsNotNone(knowledge_base.get_class_reference("com.example.C", other))
+
+    def test_reloaded_metadata_drops_old_references(self):
+        # The GUI's reload: drop the merged dict, build a new one of the same size
+        def merged(method):
+            return {"com.example.A": {"methods": {method: {"parameters": [], "is_test": True}}}}
+        for clear in (False, True):
+            with self.subTest(clear_reference_cache=clear):
+                for _ in range(20):
+                    metadata = merged("oldMethod")
+                    self.assertIsNotNone(knowledge_base.get_method_reference(
+                        "com.example.A", "oldMethod", metadata))
+                    del metadata
+                    if clear:
+                        knowledge_base.clear_reference_cache()
+                    metadata = merged("newMethod")
+                    self.assertIsNone(knowledge_base.get_method_reference(
+                        "com.example.A", "oldMethod", metadata))
+                    self.assertNotIn("oldMethod", knowledge_base.get_class_reference("com.example.A", metadata))
+
+    def test_clear_reference_cache_releases_metadata(self):
+        class Metadata(dict):
+            """A dict that can be weakly referenced."""
+        metadata = Metadata({"com.example.A": {"methods": {"t": {"is_test": True}}}})
+        knowledge_base.get_class_reference("com.example.A", metadata)
+        knowledge_base.get_method_reference("com.example.A", "t", metadata)
+        ref = weakref.ref(metadata)
+        del metadata
+        knowledge_base.clear_reference_cache()
+        gc.collect()
+        self.assertIsNone(ref())
+
+    def test_class_reference_cached_until_cleared(self):
+        cls_meta = {"methods": {"t": {"is_test": True}}}
+        merged = {"com.example.B": cls_meta}
+        ref = knowledge_base.get_class_reference("com.example.B", merged)
+        self.assertIs(knowledge_base.get_class_reference("com.example.B", merged), ref)
+        # An edited class is rendered again once the cache is cleared
+        cls_meta["methods"]["u"] = {"is_test": True}
+        knowledge_base.clear_reference_cache()
+        self.assertIn("Total methods: 2", knowledge_base.get_class_reference("com.example.B", merged))
+
+    def test_scan_mistakes_finds_known_phrases(self):
+        text = "notes: <test name=\"\"> with empty name; Typo in enum value"
+        matches = knowledge_base.scan_mistakes(text)
+        found = {(code, text[start:end]) for code, start, end in matches}
+        self.assertIn(("E103", '<test name=""> with empty name'), found)
+        self.assertIn(("E303", "Typo in enum value"), found)
+        self.assertEqual(knowledge_base.scan_mistakes("<suite name='S'/>"), [])
+
+
 class TestAutoFixer(unittest.TestCase):
     """Test the auto-fix engine."""
 
     def test_fix_e170_removes_spaces(self):
         lines = ['<class name="Test Class"/>\n']
-        err = ValidationError(code="E170", message="Space", line=1,
-                              severity=Severity.ERROR, context_data="Test Class")
+        err = _err("E170", "Space", context_data="Test Class")
         ok, msg = apply_auto_fix(err, lines)
         self.assertTrue(ok)
         self.assertIn("TestClass", lines[0])
 
     def test_fix_e101_adds_suite_name(self):
         lines = ['<suite>\n']
-        err = ValidationError(code="E101", message="Missing name", line=1,
-                              severity=Severity.ERROR)
+        err = _err("E101", "Missing name")
         ok, msg = apply_auto_fix(err, lines)
         self.assertTrue(ok)
         self.assertIn('name="TestSuite"', lines[0])
 
     def test_fix_e103_adds_test_name(self):
         lines = ['<test>\n']
-        err = ValidationError(code="E103", message="Missing name", line=1,
-                              severity=Severity.ERROR)
+        err = _err("E103", "Missing name")
         ok, msg = apply_auto_fix(err, lines)
         self.assertTrue(ok)
         self.assertIn('name="Test1"', lines[0])
 
     def test_fix_e112_adds_class_name(self):
         lines = ['<class/>\n']
-        err = ValidationError(code="E112", message="Missing name", line=1,
-                              severity=Severity.ERROR)
+        err = _err("E112", "Missing name")
         ok, msg = apply_auto_fix(err, lines)
         self.assertTrue(ok)
         self.assertIn('name=', lines[0])
 
     def test_fix_invalid_line(self):
         lines = ['<test/>\n']
-        err = ValidationError(code="E170", message="Space", line=99,
-                              severity=Severity.ERROR)
+        err = _err("E170", "Space", line=99)
         ok, msg = apply_auto_fix(err, lines)
         self.assertFalse(ok)
 
     def test_unfixable_code(self):
         lines = ['<suite name="S">\n']
-        err = ValidationError(code="E200", message="Mismatch", line=1,
-                              severity=Severity.ERROR)
+        err = _err("E200", "Mismatch")
         ok, msg = apply_auto_fix(err, lines)
         self.assertFalse(ok)
 
@@ -119,44 +267,41 @@ class TestAutoFixer(unittest.TestCase):
 class TestBatchAutoFix(unittest.TestCase):
     """Test batch auto-fix functionality."""
 
+    @classmethod
+    def setUpClass(cls):
+        cls._tmpdir = tempfile.mkdtemp()
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls._tmpdir, ignore_errors=True)
+
+    def _write_xml(self, content):
+        """Write content to a per-test file in the class temp dir."""
+        path = os.path.join(self._tmpdir, f"{self._testMethodName}.xml")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
     def test_batch_fix_creates_backup(self):
         content = '<suite>\n<test>\n<classes><class name="C"/></classes>\n</test>\n</suite>\n'
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.xml',
-                                          delete=False, encoding='utf-8') as f:
-            f.write(content)
-            path = f.name
-
-        try:
-            errors = [
-                ValidationError(code="E101", message="Missing name", line=1,
-                                severity=Severity.ERROR),
-            ]
-            fixed, total, msg = batch_auto_fix(path, errors, create_backup=True)
-            self.assertGreaterEqual(fixed, 0)
-            # Check backup was created
-            self.assertTrue(os.path.exists(path + ".bak"))
-        finally:
-            os.unlink(path)
-            if os.path.exists(path + ".bak"):
-                os.unlink(path + ".bak")
+        path = self._write_xml(content)
+        errors = [
+            _err("E101", "Missing name"),
+        ]
+        fixed, total, msg = batch_auto_fix(path, errors, create_backup=True)
+        self.assertGreaterEqual(fixed, 0)
+        # Check backup was created
+        self.assertTrue(os.path.exists(path + ".bak"))
 
     def test_batch_no_fixable(self):
         content = '<suite name="S"><test name="T"><classes><class name="C"/></classes></test></suite>'
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.xml',
-                                          delete=False, encoding='utf-8') as f:
-            f.write(content)
-            path = f.name
-
-        try:
-            errors = [
-                ValidationError(code="E200", message="Mismatch", line=1,
-                                severity=Severity.ERROR),
-            ]
-            fixed, total, msg = batch_auto_fix(path, errors)
-            self.assertEqual(fixed, 0)
-            self.assertEqual(total, 0)
-        finally:
-            os.unlink(path)
+        path = self._write_xml(content)
+        errors = [
+            _err("E200", "Mismatch"),
+        ]
+        fixed, total, msg = batch_auto_fix(path, errors)
+        self.assertEqual(fixed, 0)
+        self.assertEqual(total, 0)
 
 
 if __name__ == "__main__":
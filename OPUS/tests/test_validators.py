@@ -8,40 +8,60 @@ import os
 import sys
 import tempfile
 import unittest
+import multiprocessing
+from unittest import mock
 
 # Ensure project root is on path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from OPUS.validators.sax_validator import validate_file
-from OPUS.models import Severity
-from OPUS.config import CODE_META
+from OPUS.validators.sax_validator import validate_file, validate_string
+from OPUS.validators import batch
+from OPUS.validators.batch import validate_files
+from OPUS.models import Severity, ValidationError, ValidationResult
+from OPUS.config import CODE_META, PARALLEL_MIN_FILES, PARALLEL_MIN_FILES_SPAWN, WORKER_METADATA_MB
+
+
+_EXPECTED_CODES = frozenset({
+    "E100", "E101", "E102", "E103", "E104", "E105", "E106",
+    "E107", "E108", "E109", "E110", "E111", "E112", "E113",
+    "E114", "E115", "E116", "E117", "E120", "E121", "E122",
+    "E123", "E124", "E130", "E131", "E132", "E145", "E160",
+    "E161", "E170", "E180", "E181", "E182", "E183", "E184",
+    "E185", "E200", "E201", "E300", "E301", "E302", "E303", "E310",
+})
+
+# Shared snippets: one test T running class C, and the smallest valid suite
+_TEST_T = '''<test name="T"><classes><class name="C"/></classes></test>'''
+_MINIMAL_SUITE = f'''<suite name="S">{_TEST_T}</suite>'''
+
+
+def _exit_on_crash_xml(path, metadata=None):
+    """validate_file() stand-in whose worker process dies on crash.xml."""
+    if path.endswith("crash.xml"):
+        os._exit(1)
+    return validate_file(path, metadata)
 
 
 class TestErrorCodeCoverage(unittest.TestCase):
     """Verify all error codes are defined in CODE_META."""
 
     def test_all_codes_defined(self):
-        expected = [
-            "E100", "E101", "E102", "E103", "E104", "E105", "E106",
-            "E107", "E108", "E109", "E110", "E111", "E112", "E113",
-            "E114", "E115", "E116", "E117", "E120", "E121", "E122",
-            "E123", "E124", "E130", "E131", "E132", "E145", "E160",
-            "E161", "E170", "E180", "E181", "E182", "E183", "E184",
-            "E185", "E200", "E201", "E300", "E301", "E302", "E303", "E310",
-        ]
-        for code in expected:
-            self.assertIn(code, CODE_META, f"Missing code: {code}")
+        missing = _EXPECTED_CODES - CODE_META.keys()
+        self.assertFalse(missing, f"Missing codes: {sorted(missing)}")
 
 
 class BaseValidatorTest(unittest.TestCase):
     """Base class providing helper methods for validator tests."""
 
     def _validate_xml(self, xml_content: str, metadata=None):
+        """Validate XML in memory, return result."""
+        return validate_string(xml_content, metadata)
+
+    def _validate_xml_file(self, xml_content: str, metadata=None):
         """Write XML to temp file, validate, return result."""
         with tempfile.NamedTemporaryFile(mode='w', suffix='.xml',
                                           delete=False, encoding='utf-8') as f:
             f.write(xml_content)
-            f.flush()
             path = f.name
 
         try:
@@ -49,13 +69,20 @@ class BaseValidatorTest(unittest.TestCase):
         finally:
             os.unlink(path)
 
+    def _validate_with_suite_attrs(self, attrs: dict, metadata=None):
+        """Validate the minimal suite with extra <suite> attributes."""
+        extra = "".join(f' {name}="{value}"' for name, value in attrs.items())
+        return self._validate_xml(f'<suite name="S"{extra}>{_TEST_T}</suite>', metadata)
+
     def _assert_has_code(self, result, code, msg=""):
-        codes = [e.code for e in result.errors]
-        self.assertIn(code, codes, f"Expected {code} in errors. Got: {codes}. {msg}")
+        if code not in result.code_set:
+            codes = [e.code for e in result.errors]
+            self.fail(f"Expected {code} in errors. Got: {codes}. {msg}")
 
     def _assert_no_code(self, result, code, msg=""):
-        codes = [e.code for e in result.errors]
-        self.assertNotIn(code, codes, f"Unexpected {code} in errors. Got: {codes}. {msg}")
+        if code in result.code_set:
+            codes = [e.code for e in result.errors]
+            self.fail(f"Unexpected {code} in errors. Got: {codes}. {msg}")
 
     def _assert_valid(self, result, msg=""):
         self.assertTrue(result.is_valid, f"Expected valid. Errors: {[(e.code, e.message) for e in result.errors]}. {msg}")
@@ -68,7 +95,7 @@ class TestValidSuites(BaseValidatorTest):
     """Test that valid XML passes validation."""
 
     def test_minimal_valid_suite(self):
-        xml = '''<suite name="S"><test name="T"><classes><class name="C"/></classes></test></suite>'''
+        xml = _MINIMAL_SUITE
         result = self._validate_xml(xml)
         self._assert_valid(result)
 
@@ -100,11 +127,11 @@ class TestValidSuites(BaseValidatorTest):
         self._assert_valid(result)
 
     def test_suite_with_listeners(self):
-        xml = '''<suite name="S">
+        xml = f'''<suite name="S">
             <listeners>
                 <listener class-name="com.example.Listener"/>
             </listeners>
-            <test name="T"><classes><class name="C"/></classes></test>
+            {_TEST_T}
         </suite>'''
         result = self._validate_xml(xml)
         self._assert_valid(result)
@@ -137,152 +164,84 @@ class TestValidSuites(BaseValidatorTest):
         self._assert_valid(result)
 
     def test_suite_with_valid_attributes(self):
-        xml = '''<suite name="S" parallel="methods" thread-count="5" verbose="2" preserve-order="true">
-            <test name="T"><classes><class name="C"/></classes></test>
-        </suite>'''
-        result = self._validate_xml(xml)
+        result = self._validate_with_suite_attrs({
+            "parallel": "methods", "thread-count": "5", "verbose": "2", "preserve-order": "true",
+        })
         self._assert_valid(result)
 
 
 class TestStructuralErrors(BaseValidatorTest):
     """Test structural validation rules."""
 
-    def test_e101_suite_missing_name(self):
-        xml = '''<suite><test name="T"><classes><class name="C"/></classes></test></suite>'''
-        result = self._validate_xml(xml)
-        self._assert_has_code(result, "E101")
-
-    def test_e102_multiple_suites(self):
-        xml = '''<suite name="S1"><test name="T"><classes><class name="C"/></classes></test></suite>'''
-        # SAX will report error for second suite (not well-formed with 2 roots)
-        # This test verifies the validator handles it gracefully
-        result = self._validate_xml(xml)
-        # Single suite should be fine
-        self._assert_no_code(result, "E102")
-
-    def test_e103_test_missing_name(self):
-        xml = '''<suite name="S"><test><classes><class name="C"/></classes></test></suite>'''
-        result = self._validate_xml(xml)
-        self._assert_has_code(result, "E103")
-
-    def test_e104_duplicate_test_name(self):
-        xml = '''<suite name="S">
+    # (expected code, what is wrong, XML)
+    CASES = [
+        ("E101", "suite missing name", f'''<suite>{_TEST_T}</suite>'''),
+        ("E103", "test missing name",
+         '''<suite name="S"><test><classes><class name="C"/></classes></test></suite>'''),
+        ("E104", "duplicate test name", '''<suite name="S">
             <test name="T1"><classes><class name="C1"/></classes></test>
             <test name="T1"><classes><class name="C2"/></classes></test>
-        </suite>'''
-        result = self._validate_xml(xml)
-        self._assert_has_code(result, "E104")
-
-    def test_e105_missing_suite(self):
-        xml = '''<test name="T"><classes><class name="C"/></classes></test>'''
-        result = self._validate_xml(xml)
-        self._assert_has_code(result, "E105")
-
-    def test_e106_empty_suite(self):
-        xml = '''<suite name="S"></suite>'''
-        result = self._validate_xml(xml)
-        self._assert_has_code(result, "E106")
-
-    def test_e107_empty_classes(self):
-        xml = '''<suite name="S"><test name="T"><classes></classes></test></suite>'''
-        result = self._validate_xml(xml)
-        self._assert_has_code(result, "E107")
-
-    def test_e108_empty_methods(self):
-        xml = '''<suite name="S"><test name="T"><classes>
+        </suite>'''),
+        ("E105", "missing suite", _TEST_T),
+        ("E106", "empty suite", '''<suite name="S"></suite>'''),
+        ("E107", "empty classes",
+         '''<suite name="S"><test name="T"><classes></classes></test></suite>'''),
+        ("E108", "empty methods", '''<suite name="S"><test name="T"><classes>
             <class name="C"><methods></methods></class>
-        </classes></test></suite>'''
-        result = self._validate_xml(xml)
-        self._assert_has_code(result, "E108")
-
-    def test_e109_empty_packages(self):
-        xml = '''<suite name="S"><test name="T"><packages></packages></test></suite>'''
-        result = self._validate_xml(xml)
-        self._assert_has_code(result, "E109")
-
-    def test_e110_classes_outside_test(self):
-        xml = '''<suite name="S"><classes><class name="C"/></classes></suite>'''
-        result = self._validate_xml(xml)
-        self._assert_has_code(result, "E110")
-
-    def test_e111_class_outside_classes(self):
-        xml = '''<suite name="S"><test name="T"><class name="C"/></test></suite>'''
-        result = self._validate_xml(xml)
-        self._assert_has_code(result, "E111")
-
-    def test_e112_class_missing_name(self):
-        xml = '''<suite name="S"><test name="T"><classes><class/></classes></test></suite>'''
-        result = self._validate_xml(xml)
-        self._assert_has_code(result, "E112")
-
-    def test_e113_packages_outside_test(self):
-        xml = '''<suite name="S"><packages><package name="p"/></packages></suite>'''
-        result = self._validate_xml(xml)
-        self._assert_has_code(result, "E113")
-
-    def test_e114_mix_classes_and_packages(self):
-        xml = '''<suite name="S"><test name="T">
+        </classes></test></suite>'''),
+        ("E109", "empty packages",
+         '''<suite name="S"><test name="T"><packages></packages></test></suite>'''),
+        ("E110", "classes outside test",
+         '''<suite name="S"><classes><class name="C"/></classes></suite>'''),
+        ("E111", "class outside classes",
+         '''<suite name="S"><test name="T"><class name="C"/></test></suite>'''),
+        ("E112", "class missing name",
+         '''<suite name="S"><test name="T"><classes><class/></classes></test></suite>'''),
+        ("E113", "packages outside test",
+         '''<suite name="S"><packages><package name="p"/></packages></suite>'''),
+        ("E114", "mix of classes and packages", '''<suite name="S"><test name="T">
             <classes><class name="C"/></classes>
             <packages><package name="p"/></packages>
-        </test></suite>'''
-        result = self._validate_xml(xml)
-        self._assert_has_code(result, "E114")
-
-    def test_e116_package_missing_name(self):
-        xml = '''<suite name="S"><test name="T"><packages><package/></packages></test></suite>'''
-        result = self._validate_xml(xml)
-        self._assert_has_code(result, "E116")
-
-    def test_e117_invalid_package_name(self):
-        xml = '''<suite name="S"><test name="T"><packages>
+        </test></suite>'''),
+        ("E116", "package missing name",
+         '''<suite name="S"><test name="T"><packages><package/></packages></test></suite>'''),
+        ("E117", "invalid package name", '''<suite name="S"><test name="T"><packages>
             <package name="123.bad"/>
-        </packages></test></suite>'''
-        result = self._validate_xml(xml)
-        self._assert_has_code(result, "E117")
-
-    def test_e120_methods_outside_class(self):
-        xml = '''<suite name="S"><test name="T"><classes>
+        </packages></test></suite>'''),
+        ("E120", "methods outside class", '''<suite name="S"><test name="T"><classes>
             <methods><include name="m"/></methods>
-        </classes></test></suite>'''
-        result = self._validate_xml(xml)
-        self._assert_has_code(result, "E120")
-
-    def test_e122_include_missing_name(self):
-        xml = '''<suite name="S"><test name="T"><classes>
+        </classes></test></suite>'''),
+        ("E122", "include missing name", '''<suite name="S"><test name="T"><classes>
             <class name="C"><methods><include/></methods></class>
-        </classes></test></suite>'''
-        result = self._validate_xml(xml)
-        self._assert_has_code(result, "E122")
-
-    def test_e124_exclude_missing_name(self):
-        xml = '''<suite name="S"><test name="T"><classes>
+        </classes></test></suite>'''),
+        ("E124", "exclude missing name", '''<suite name="S"><test name="T"><classes>
             <class name="C"><methods><exclude/></methods></class>
-        </classes></test></suite>'''
-        result = self._validate_xml(xml)
-        self._assert_has_code(result, "E124")
-
-    def test_e130_param_missing_name(self):
-        xml = '''<suite name="S"><parameter value="v"/>
-            <test name="T"><classes><class name="C"/></classes></test>
-        </suite>'''
-        result = self._validate_xml(xml)
-        self._assert_has_code(result, "E130")
-
-    def test_e131_param_missing_value(self):
-        xml = '''<suite name="S"><parameter name="n"/>
-            <test name="T"><classes><class name="C"/></classes></test>
-        </suite>'''
-        result = self._validate_xml(xml)
-        self._assert_has_code(result, "E131")
-
-    def test_e132_duplicate_parameter(self):
-        xml = '''<suite name="S">
+        </classes></test></suite>'''),
+        ("E130", "parameter missing name", f'''<suite name="S"><parameter value="v"/>
+            {_TEST_T}
+        </suite>'''),
+        ("E131", "parameter missing value", f'''<suite name="S"><parameter name="n"/>
+            {_TEST_T}
+        </suite>'''),
+        ("E132", "duplicate parameter", f'''<suite name="S">
             <parameter name="p" value="v1"/>
             <parameter name="p" value="v2"/>
-            <test name="T"><classes><class name="C"/></classes></test>
-        </suite>'''
+            {_TEST_T}
+        </suite>'''),
+    ]
+
+    def test_structural_codes(self):
+        for code, problem, xml in self.CASES:
+            with self.subTest(code=code, problem=problem):
+                self._assert_has_code(self._validate_xml(xml), code)
+
+    def test_e102_multiple_suites(self):
+        xml = f'''<suite name="S1">{_TEST_T}</suite>'''
+        # SAX will report error for second suite (not well-formed with 2 roots)
+        # This test verifies the validator handles it gracefully
         result = self._validate_xml(xml)
-        self._assert_has_code(result, "E132")
+        # Single suite should be fine
+        self._assert_no_code(result, "E102")
 
 
 class TestDuplicateDetection(BaseValidatorTest):
@@ -338,38 +297,23 @@ class TestAttributeValidation(BaseValidatorTest):
     """Test attribute validation rules."""
 
     def test_e180_invalid_parallel(self):
-        xml = '''<suite name="S" parallel="invalid">
-            <test name="T"><classes><class name="C"/></classes></test>
-        </suite>'''
-        result = self._validate_xml(xml)
+        result = self._validate_with_suite_attrs({"parallel": "invalid"})
         self._assert_has_code(result, "E180")
 
     def test_e181_invalid_thread_count(self):
-        xml = '''<suite name="S" thread-count="-5">
-            <test name="T"><classes><class name="C"/></classes></test>
-        </suite>'''
-        result = self._validate_xml(xml)
+        result = self._validate_with_suite_attrs({"thread-count": "-5"})
         self._assert_has_code(result, "E181")
 
     def test_e181_non_numeric_thread_count(self):
-        xml = '''<suite name="S" thread-count="abc">
-            <test name="T"><classes><class name="C"/></classes></test>
-        </suite>'''
-        result = self._validate_xml(xml)
+        result = self._validate_with_suite_attrs({"thread-count": "abc"})
         self._assert_has_code(result, "E181")
 
     def test_e182_invalid_verbose(self):
-        xml = '''<suite name="S" verbose="20">
-            <test name="T"><classes><class name="C"/></classes></test>
-        </suite>'''
-        result = self._validate_xml(xml)
+        result = self._validate_with_suite_attrs({"verbose": "20"})
         self._assert_has_code(result, "E182")
 
     def test_e183_invalid_preserve_order(self):
-        xml = '''<suite name="S" preserve-order="maybe">
-            <test name="T"><classes><class name="C"/></classes></test>
-        </suite>'''
-        result = self._validate_xml(xml)
+        result = self._validate_with_suite_attrs({"preserve-order": "maybe"})
         self._assert_has_code(result, "E183")
 
 
@@ -392,6 +336,19 @@ class TestMetadataValidation(BaseValidatorTest):
         result = self._validate_xml(xml, metadata)
         self._assert_has_code(result, "E301")
 
+    def test_e301_with_extracted_metadata(self):
+        # Extractor output: methods maps name -> signature info
+        metadata = {"C": {"methods": {"realMethod": {"parameters": []}}}}
+        xml = '''<suite name="S"><test name="T"><classes>
+            <class name="C"><methods>
+                <include name="realMethod"/><include name="realMethd"/>
+            </methods></class>
+        </classes></test></suite>'''
+        result = self._validate_xml(xml, metadata)
+        e301 = result.errors_by_code()["E301"]
+        self.assertEqual([e.context_data for e in e301], ["realMethd"])
+        self.assertEqual(e301[0].suggestion, "Did you mean: realMethod?")
+
     def test_known_class_passes(self):
         metadata = {"com.example.TestClass": {"methods": ["testLogin"]}}
         xml = '''<suite name="S"><test name="T"><classes>
@@ -466,14 +423,19 @@ class TestEdgeCases(BaseValidatorTest):
         result = self._validate_xml("<suite name='S'><test>")
         self._assert_has_code(result, "E100")
 
+    def test_reused_parser_recovers_after_error(self):
+        self._assert_has_code(self._validate_xml("<suite name='S'><test>"), "E100")
+        xml = _MINIMAL_SUITE
+        self._assert_valid(self._validate_xml(xml))
+
     def test_dtd_declaration_accepted(self):
         xml = '''<!DOCTYPE suite SYSTEM "https://testng.org/testng-1.0.dtd">
-        <suite name="S"><test name="T"><classes><class name="C"/></classes></test></suite>'''
+        ''' + _MINIMAL_SUITE
         result = self._validate_xml(xml)
         self._assert_valid(result)
 
     def test_result_properties(self):
-        xml = '''<suite name="S"><test name="T"><classes><class name="C"/></classes></test></suite>'''
+        xml = _MINIMAL_SUITE
         result = self._validate_xml(xml)
         self.assertEqual(result.status, "PASS")
         self.assertEqual(result.error_count, 0)
@@ -481,6 +443,104 @@ class TestEdgeCases(BaseValidatorTest):
         self.assertTrue(result.is_valid)
         self.assertGreater(result.duration_ms, 0)
 
+    def test_validate_string_matches_file(self):
+        duplicates = '''<suite name="S"><test name="T"><classes>
+            <class name="C"/><class name="C"/><class name="bad name"/>
+        </classes></test><test name="T"/></suite>'''
+        # U+2028 is a line break to str.splitlines() but not to expat
+        separator = '''<suite name="S">
+<!-- a\u2028b -->
+<test name="T"><classes><class name="bad name"/></classes></test></suite>'''
+        for xml in (duplicates, separator):
+            with self.subTest(xml=xml[:40]):
+                from_file = self._validate_xml_file(xml)
+                from_string = self._validate_xml(xml)
+                self.assertEqual(from_string.file_path, "<string>")
+                self.assertTrue(from_string.errors)
+                self.assertEqual(
+                    [(e.code, e.line, e.message, e.line_content) for e in from_string.errors],
+                    [(e.code, e.line, e.message, e.line_content) for e in from_file.errors],
+                )
+
+    def test_large_document_parsed_in_chunks(self):
+        # ~100 KB: SAX reads 64 KB at a time, so the findings sit past a buffer boundary
+        classes = "".join(f'\n<class name="com.example.C{i}"/>' for i in range(3000))
+        xml = f'''<suite name="S"><test name="T"><classes>{classes}
+<class name="com.example.C7"/>
+<class name="bad name"/>
+</classes></test></suite>'''
+        for result in (self._validate_xml(xml), self._validate_xml_file(xml)):
+            with self.subTest(file_path=result.file_path):
+                self.assertEqual([(e.code, e.line) for e in result.errors],
+                                 [("E160", 3002), ("E170", 3003)])
+
+
+class TestBatchValidation(unittest.TestCase):
+    """Test multi-file validation across worker processes."""
+
+    def _write_suites(self, tmp, names):
+        paths = []
+        for i, name in enumerate(names):
+            path = os.path.join(tmp, name)
+            classes = '<class name="C"/>' * i
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(f'<suite name="S"><test name="T"><classes>{classes}</classes></test></suite>')
+            paths.append(path)
+        return paths
+
+    def test_worker_pool_matches_sequential(self):
+        metadata = {"C": {"methods": {}}}
+        for method in ("default", "spawn"):
+            with self.subTest(start_method=method), tempfile.TemporaryDirectory() as tmp, \
+                    mock.patch.object(batch, "PARALLEL_MIN_FILES_SPAWN", PARALLEL_MIN_FILES):
+                paths = self._write_suites(tmp, [f"suite{i}.xml" for i in range(PARALLEL_MIN_FILES)])
+                context = multiprocessing.get_context("spawn") if method == "spawn" else None
+                sequential = list(validate_files(paths, metadata, jobs=1))
+                pooled = list(validate_files(paths, metadata, jobs=2, mp_context=context))
+
+                self.assertEqual([r.file_path for r in pooled], paths)
+                self.assertEqual([[e.code for e in r.errors] for r in pooled],
+                                 [[e.code for e in r.errors] for r in sequential])
+                self.assertEqual(pooled[0].errors[0].code, "E107")
+                self.assertTrue(all(r.metadata_used for r in pooled))
+
+    @unittest.skipUnless("fork" in multiprocessing.get_all_start_methods(), "needs fork")
+    def test_dead_worker_reported_per_file(self):
+        names = [f"suite{i}.xml" for i in range(PARALLEL_MIN_FILES)]
+        names[2] = "crash.xml"
+        with tempfile.TemporaryDirectory() as tmp, \
+                mock.patch.object(batch, "validate_file", _exit_on_crash_xml):
+            paths = self._write_suites(tmp, names)
+            results = list(validate_files(paths, jobs=2, mp_context=multiprocessing.get_context("fork")))
+
+        self.assertEqual([r.file_path for r in results], paths)
+        crashed = results[2]
+        self.assertEqual([e.code for e in crashed.errors], ["E000"])
+        self.assertIn("worker process terminated", crashed.errors[0].message)
+
+    def test_pool_startup_failure_falls_back_to_sequential(self):
+        with tempfile.TemporaryDirectory() as tmp, \
+                mock.patch.object(batch, "ProcessPoolExecutor", side_effect=OSError("no processes")):
+            paths = self._write_suites(tmp, [f"suite{i}.xml" for i in range(PARALLEL_MIN_FILES)])
+            results = list(validate_files(paths, jobs=2))
+
+        self.assertEqual([r.file_path for r in results], paths)
+        self.assertEqual(results[0].errors[0].code, "E107")
+        self.assertFalse(any(e.code == "E000" for r in results for e in r.errors))
+
+    def test_spawn_needs_a_larger_batch(self):
+        self.assertTrue(batch.use_worker_pool(PARALLEL_MIN_FILES, 2, None, "fork"))
+        self.assertFalse(batch.use_worker_pool(PARALLEL_MIN_FILES, 2, None, "spawn"))
+        self.assertTrue(batch.use_worker_pool(PARALLEL_MIN_FILES_SPAWN, 2, None, "spawn"))
+
+    def test_metadata_size_estimated_without_pickling(self):
+        method_count = (WORKER_METADATA_MB * 1024 * 1024) // batch._PICKLED_BYTES_PER_METHOD + 1
+        large = {"C": {"methods": dict.fromkeys(range(method_count), {})}}
+        self.assertTrue(batch.use_worker_pool(PARALLEL_MIN_FILES_SPAWN, 2, {"C": {"methods": {}}}, "spawn"))
+        self.assertFalse(batch.use_worker_pool(PARALLEL_MIN_FILES_SPAWN, 2, large, "spawn"))
+        # fork shares the parent's metadata, so its size does not matter
+        self.assertTrue(batch.use_worker_pool(PARALLEL_MIN_FILES, 2, large, "fork"))
+
 
 class TestValidationResult(BaseValidatorTest):
     """Test ValidationResult properties and methods."""
@@ -501,6 +561,25 @@ class TestValidationResult(BaseValidatorTest):
         by_sev = result.errors_by_severity()
         self.assertIn(Severity.WARNING, by_sev)
 
+    def test_counts_and_codes_follow_errors(self):
+        result = ValidationResult(file_path="t.xml", errors=[
+            ValidationError(code="E100", message="e"),
+            ValidationError(code="E170", message="w", severity=Severity.WARNING),
+        ])
+        self.assertEqual((result.error_count, result.warning_count, result.info_count), (1, 1, 0))
+        result.add_error(ValidationError(code="E300", message="i", severity=Severity.INFO))
+        self.assertEqual(result.info_count, 1)
+        self.assertEqual(result.code_set, {"E100", "E170", "E300"})
+        result.extend_errors([ValidationError(code="E107", message="e2")])
+        self.assertEqual(result.error_count, 2)
+        self.assertIn("E107", result.code_set)
+        # Same length, different severities and codes
+        result.errors = [ValidationError(code="E170", message="w", severity=Severity.WARNING)
+                         for _ in range(4)]
+        self.assertEqual((result.error_count, result.warning_count, result.info_count), (0, 4, 0))
+        self.assertEqual(result.code_set, {"E170"})
+        self.assertEqual(result.status_label, "PASS (warnings)")
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
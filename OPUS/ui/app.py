@@ -15,10 +15,11 @@ Modern tkinter-based interface with:
 """
 
 import os
-import json
 import logging
+import multiprocessing
 import threading
 import tkinter as tk
+from collections import Counter
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 from typing import Optional, Dict, List
 from pathlib import Path
@@ -28,16 +29,18 @@ from ..config import (
     LIGHT_THEME, DARK_THEME, ThemeColors, AppConfig,
 )
 from ..models import (
-    ValidationError, ValidationResult, FileEntry, Severity,
+    ValidationError, FileEntry, Severity,
 )
-from ..validators import validate_file
+from ..validators import validate_file, validate_files
 from ..fixes import generate_fix, apply_auto_fix, batch_auto_fix
 from ..fixes.knowledge_base import (
     get_knowledge, get_class_reference, get_method_reference,
-    get_missing_params_info,
+    get_missing_params_info, render_mistakes, clear_reference_cache,
 )
 from ..utils import format_xml_content, format_xml_file, read_file_safe
-from ..utils.file_utils import find_xml_files, validate_file_path
+from ..utils.file_utils import (
+    find_xml_files, intern_json_strings, load_json_file, validate_file_path,
+)
 from ..exporters import export_html, export_csv, export_json
 
 logger = logging.getLogger(__name__)
@@ -51,11 +54,11 @@ try:
 except ImportError:
     HAS_MODERN_UI = False
 
-# Optional syntax highlighting
+# Optional syntax highlighting. Only the package is probed here:
+# pygments.lexers scans installed plugins on import (~70 ms), so a
+# lexer should be built on first use, not at startup.
 try:
-    from pygments import lex
-    from pygments.lexers import XmlLexer
-    from pygments.token import Token
+    import pygments  # noqa: F401
     HAS_SYNTAX_HIGHLIGHT = True
 except ImportError:
     HAS_SYNTAX_HIGHLIGHT = False
@@ -78,6 +81,8 @@ class ValidatorApp:
         self.files: Dict[str, FileEntry] = {}
         self.metadata: Optional[dict] = None
         self.maven_metadata: Optional[dict] = None
+        # Merged view of both sources; rebuilt only when either changes
+        self._merged_metadata: Optional[dict] = None
         self.current_theme = self.config.theme
         self.colors = LIGHT_THEME
         self._validation_lock = threading.Lock()
@@ -385,19 +390,16 @@ class ValidatorApp:
 
     def _process_dropped_paths(self, paths):
         """Process a list of dropped file/folder paths."""
-        added = 0
+        xml_paths = []
         for p in paths:
             p = p.strip('{}')  # Windows wraps paths with spaces in braces
             if os.path.isfile(p) and p.lower().endswith('.xml'):
-                if self._add_single_file(p):
-                    added += 1
+                xml_paths.append(p)
             elif os.path.isdir(p):
-                for xml_path in find_xml_files(p):
-                    if self._add_single_file(xml_path):
-                        added += 1
+                xml_paths.extend(find_xml_files(p))
+        added = self._add_files(xml_paths)
         if added:
             self._set_status(f"Added {added} file(s) via drag & drop")
-            self._update_drop_hint()
 
     def _update_drop_hint(self):
         """Show or hide the drop hint overlay based on file count."""
@@ -501,10 +503,7 @@ class ValidatorApp:
             filetypes=[("XML Files", "*.xml"), ("All Files", "*.*")],
             initialdir=init_dir,
         )
-        added = 0
-        for p in paths:
-            if self._add_single_file(p):
-                added += 1
+        added = self._add_files(paths)
         if paths:
             parent = str(Path(paths[0]).parent)
             self.config.last_directory = parent
@@ -521,31 +520,37 @@ class ValidatorApp:
         self.config.last_directory = folder
         self.config.last_validation_path = folder
         self.config.save()
-        xml_files = find_xml_files(folder)
-        added = 0
-        for p in xml_files:
-            if self._add_single_file(p):
-                added += 1
+        added = self._add_files(find_xml_files(folder))
         self._set_status(f"Added {added} file(s) from folder")
 
     def _add_single_file(self, path: str) -> bool:
+        return self._add_files([path]) == 1
+
+    def _add_files(self, paths) -> int:
+        """Add files to the list; the config, recent menu and drop hint are updated once."""
+        added = [p for p in map(self._register_file, paths) if p]
+        if added:
+            self.config.add_recent_files(added)
+            self._update_recent_menu()
+            self._update_drop_hint()
+        return len(added)
+
+    def _register_file(self, path: str) -> Optional[str]:
+        """Create the entry and tree row for path; return its resolved path, or None if skipped."""
         path = str(Path(path).resolve())
         if path in self.files:
-            return False
+            return None
 
         valid, err_msg = validate_file_path(path)
         if not valid:
             logger.warning("Skipping invalid file %s: %s", path, err_msg)
-            return False
+            return None
 
         entry = FileEntry(path=path)
         self.files[path] = entry
         self.tree.insert("", "end", iid=path,
                          values=("\u2611", entry.basename, "\u23f3 Pending", "-", "-"))
-        self.config.add_recent_file(path)
-        self._update_recent_menu()
-        self._update_drop_hint()
-        return True
+        return path
 
     def _update_recent_menu(self):
         self.recent_menu.delete(0, tk.END)
@@ -572,8 +577,7 @@ class ValidatorApp:
             return
         entry.checked = not entry.checked
         icon = "\u2611" if entry.checked else "\u2610"
-        current = self.tree.item(item_id, "values")
-        self.tree.item(item_id, values=(icon, *current[1:]))
+        self.tree.set(item_id, "check", icon)
 
     def _toggle_all_checks(self):
         if not self.files:
@@ -581,10 +585,11 @@ class ValidatorApp:
         first_key = next(iter(self.files))
         target = not self.files[first_key].checked
         icon = "\u2611" if target else "\u2610"
+        # One Tcl call per row, and none for rows already in the target state
         for item_id, entry in self.files.items():
-            entry.checked = target
-            vals = self.tree.item(item_id, "values")
-            self.tree.item(item_id, values=(icon, *vals[1:]))
+            if entry.checked != target:
+                entry.checked = target
+                self.tree.set(item_id, "check", icon)
 
     def _get_selected_files(self) -> List[str]:
         return [p for p, e in self.files.items() if e.checked]
@@ -606,28 +611,15 @@ class ValidatorApp:
 
     def _validate_task(self, targets: List[str]):
         with self._validation_lock:
-            # Merge metadata sources
-            merged_meta = None
-            if self.metadata or self.maven_metadata:
-                merged_meta = {}
-                if self.metadata:
-                    merged_meta.update(self.metadata)
-                if self.maven_metadata:
-                    merged_meta.update(self.maven_metadata)
-
-            for path in targets:
-                try:
-                    result = validate_file(path, merged_meta)
-                except Exception as e:
-                    logger.error("Validation crash for %s: %s", path, e)
-                    result = ValidationResult(
-                        file_path=path,
-                        errors=[ValidationError(
-                            code="E000", message=f"Crash: {e}",
-                            severity=Severity.ERROR,
-                        )],
-                    )
-
+            merged_meta = self._get_merged_metadata()
+
+            # Large batches run across worker processes; debug mode stays
+            # in-process so worker log records are not lost. Workers are
+            # spawned, never forked from this thread of the Tk process.
+            jobs = 1 if self.config.debug_mode else None
+            results = validate_files(targets, merged_meta, jobs=jobs,
+                                     mp_context=multiprocessing.get_context("spawn"))
+            for path, result in zip(targets, results):
                 self.files[path].result = result
                 self.root.after(0, self._update_tree_row, path)
 
@@ -666,36 +658,41 @@ class ValidatorApp:
         self.summary.config(state="normal")
         self.summary.delete("1.0", tk.END)
 
-        txt = f"File: {entry.basename}\n"
-        txt += f"Path: {entry.path}\n"
-        txt += f"Status: {entry.status_display}\n\n"
+        parts = [
+            f"File: {entry.basename}\n",
+            f"Path: {entry.path}\n",
+            f"Status: {entry.status_display}\n\n",
+        ]
 
-        if entry.result and entry.result.errors:
-            txt += f"Errors: {entry.result.error_count}\n"
-            txt += f"Warnings: {entry.result.warning_count}\n"
-            txt += f"Duration: {entry.result.duration_ms:.1f}ms\n\n"
-
-            # Group by code
-            by_code = entry.result.errors_by_code()
-            txt += "Breakdown:\n"
-            for code, errs in by_code.items():
-                desc = CODE_META.get(code, (code, ""))[0]
-                txt += f"  [{code}] x{len(errs)}: {desc}\n"
+        result = entry.result
+        if result and result.errors:
+            parts.append(f"Errors: {result.error_count}\n")
+            parts.append(f"Warnings: {result.warning_count}\n")
+            parts.append(f"Duration: {result.duration_ms:.1f}ms\n\n")
+
+            # Count by code (first-seen order); no per-code lists are built
+            by_code = Counter(e.code for e in result.errors)
+            parts.append("Breakdown:\n")
+            parts.extend(
+                f"  [{code}] x{count}: {CODE_META.get(code, (code, ''))[0]}\n"
+                for code, count in by_code.items()
+            )
 
-            txt += f"\nFirst 10 issues:\n"
-            for e in entry.result.errors[:10]:
+            parts.append("\nFirst 10 issues:\n")
+            for e in result.errors[:10]:
                 if e.severity == Severity.ERROR:
                     icon = "\u274c"
                 elif e.severity == Severity.WARNING:
                     icon = "\u26a0"
                 else:
                     icon = "\u2139"
-                txt += f"  {icon} L{e.line or '?'} [{e.code}] {e.message}\n"
-        elif entry.result:
-            txt += "\u2705 No issues found!\n"
+                parts.append(f"  {icon} L{e.line or '?'} [{e.code}] {e.message}\n")
+        elif result:
+            parts.append("\u2705 No issues found!\n")
         else:
-            txt += "Not yet validated.\n"
+            parts.append("Not yet validated.\n")
 
+        txt = "".join(parts)
         self.summary.insert("1.0", txt)
         self.summary.config(state="disabled")
 
@@ -944,12 +941,11 @@ class ValidatorApp:
             explain_txt.insert("end", "\n")
 
             explain_txt.insert("end", "What This Means:\n", "subheader")
-            explain_txt.insert("end", kb["explain"] + "\n\n", "")
+            explain_txt.insert("end", kb.explain + "\n\n", "")
 
-            if kb.get("mistakes"):
+            if kb.mistakes:
                 explain_txt.insert("end", "Common Mistakes That Cause This:\n", "subheader")
-                for m in kb["mistakes"]:
-                    explain_txt.insert("end", f"  \u2022 {m}\n", "warn")
+                explain_txt.insert("end", render_mistakes(err.code), "warn")
                 explain_txt.insert("end", "\n")
 
             # Add helpful cross-references
@@ -977,9 +973,9 @@ class ValidatorApp:
                 sample_txt.insert("end", "\n")
 
             # Then show the correct pattern
-            if kb.get("sample"):
+            if kb.sample:
                 sample_txt.insert("end", "Correct Pattern:\n", "subheader")
-                sample_txt.insert("end", kb["sample"] + "\n", "code")
+                sample_txt.insert("end", kb.sample + "\n", "code")
             else:
                 sample_txt.insert("end", "No sample available for this error code.\n", "muted")
 
@@ -1291,8 +1287,8 @@ class ValidatorApp:
             return
         try:
             c = self.colors
-            with open(path, encoding='utf-8') as f:
-                self.metadata = json.load(f)
+            self.metadata = intern_json_strings(load_json_file(path))
+            self._drop_merged_metadata()
             self.meta_lbl.config(
                 text=f"Meta: {len(self.metadata)} classes",
                 bg=c.success, fg="#ffffff",
@@ -1417,7 +1413,7 @@ class ValidatorApp:
             extractor = MavenMetadataExtractor()
             all_meta = {}
             for jar_path in jar_paths:
-                meta = extractor.extract_from_jar(jar_path)
+                meta = extractor.extract_cached(jar_path)
                 all_meta.update(meta)
             names = ", ".join(os.path.basename(j) for j in jar_paths)
             self._apply_maven_metadata(all_meta, f"{len(jar_paths)} JAR(s): {names}")
@@ -1441,7 +1437,7 @@ class ValidatorApp:
             extractor = MavenMetadataExtractor()
             all_meta = {}
             for jar in jars:
-                all_meta.update(extractor.extract_from_jar(jar))
+                all_meta.update(extractor.extract_cached(jar))
             self._apply_maven_metadata(all_meta, f"{len(jars)} JARs from folder")
         except Exception as e:
             messagebox.showerror("Error", f"Scan failed:\n{e}")
@@ -1453,7 +1449,8 @@ class ValidatorApp:
             dialog.destroy()
             self._set_status(f"Scanning Maven repo for {gid}:{aid}...")
             extractor = MavenMetadataExtractor()
-            metadata = extractor.scan_project_jars([gid], [aid])
+            metadata = extractor.scan_project_jars(
+                [gid], [aid], mp_context=multiprocessing.get_context("spawn"))
             self._apply_maven_metadata(metadata, f"Maven: {gid}:{aid}")
         except Exception as e:
             messagebox.showerror("Error", f"Scan failed:\n{e}")
@@ -1465,6 +1462,7 @@ class ValidatorApp:
             if self.maven_metadata is None:
                 self.maven_metadata = {}
             self.maven_metadata.update(metadata)
+            self._drop_merged_metadata()
             total = len(self.maven_metadata)
             self.meta_lbl.config(
                 text=f"Maven: {total} classes",
@@ -1481,6 +1479,7 @@ class ValidatorApp:
         """Clear all loaded Maven metadata."""
         c = self.colors
         self.maven_metadata = None
+        self._drop_merged_metadata()
         self.meta_lbl.config(
             text="No Metadata", bg=c.surface, fg=c.muted,
         )
@@ -1488,15 +1487,22 @@ class ValidatorApp:
             status_var.set("Currently loaded: 0 classes")
         self._set_status("Maven metadata cleared.")
 
+    def _drop_merged_metadata(self):
+        """Rebuild the merged metadata on next use; its cached references go too."""
+        self._merged_metadata = None
+        clear_reference_cache()
+
     def _get_merged_metadata(self) -> Optional[dict]:
         if not self.metadata and not self.maven_metadata:
             return None
-        merged = {}
-        if self.metadata:
-            merged.update(self.metadata)
-        if self.maven_metadata:
-            merged.update(self.maven_metadata)
-        return merged
+        if self._merged_metadata is None:
+            merged = {}
+            if self.metadata:
+                merged.update(self.metadata)
+            if self.maven_metadata:
+                merged.update(self.maven_metadata)
+            self._merged_metadata = merged
+        return self._merged_metadata
 
     # ─── Export ─────────────────────────────────────────────
 
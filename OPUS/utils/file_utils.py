@@ -4,12 +4,21 @@ Safe file I/O utilities with encoding detection and error handling.
 """
 
 import os
+import sys
+import json
 import logging
-from typing import List, Optional, Tuple
+from typing import Any, List, Optional, Tuple
 from pathlib import Path
 
 from ..config import ENCODING_FALLBACKS, MAX_FILE_SIZE_MB, SUPPORTED_EXTENSIONS
 
+# Optional: orjson parses large metadata files several times faster
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -113,3 +122,52 @@ def find_xml_files(folder: str) -> List[str]:
     except Exception as e:
         logger.error("Error scanning folder %s: %s", folder, e)
     return xml_files
+
+
+def load_json_file(path: str) -> Any:
+    """
+    Load a JSON file (e.g. class metadata), using orjson when installed.
+
+    Args:
+        path: JSON file path
+
+    Returns:
+        The decoded JSON value
+    """
+    if HAS_ORJSON:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_json_file(path: str, data: Any) -> None:
+    """
+    Write data as compact JSON (e.g. class metadata), using orjson when installed.
+
+    Args:
+        path: Output file path
+        data: JSON-serializable value with string keys
+    """
+    if HAS_ORJSON:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data))
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, separators=(',', ':'))
+
+
+def intern_json_strings(value: Any) -> Any:
+    """
+    Return a copy of decoded JSON with every key and string value interned.
+
+    Class metadata repeats the same type names, annotation names and
+    parameter keys in every method; interning keeps one copy of each.
+    """
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, dict):
+        return {sys.intern(k): intern_json_strings(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [intern_json_strings(v) for v in value]
+    return value
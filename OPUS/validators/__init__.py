@@ -2,5 +2,6 @@
 Validators package - Contains all validation logic for TestNG XML files.
 """
 
-from .sax_validator import validate_file
+from .sax_validator import validate_file, validate_string
 from .preflight import preflight_scan
+from .batch import validate_files
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Multi-file validation for the CLI and the GUI.
+Large batches are spread across worker processes; small ones run in
+the calling process, where worker startup would cost more than it saves.
+"""
+
+import os
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Iterator, List, Optional
+
+from ..models import ValidationError, ValidationResult, Severity
+from ..config import PARALLEL_MIN_FILES, PARALLEL_MIN_FILES_SPAWN, WORKER_METADATA_MB
+from .sax_validator import validate_file
+
+logger = logging.getLogger(__name__)
+
+# Per-process metadata for worker processes, set once by the pool
+# initializer so it is pickled per worker rather than per file.
+_worker_metadata = None
+
+# Measured pickle size of extracted metadata per method (names, parameter
+# pairs, annotations), used to estimate the size without pickling it
+_PICKLED_BYTES_PER_METHOD = 48
+
+
+def _init_worker(metadata):
+    """Pool initializer: keep the metadata for this worker process."""
+    global _worker_metadata
+    _worker_metadata = metadata
+
+
+def _validate_in_worker(path: str) -> ValidationResult:
+    """Validate one file in a worker process."""
+    return _validate_or_crash(path, _worker_metadata)
+
+
+def _crash_result(path: str, message: str) -> ValidationResult:
+    """A result carrying a single E000 for a file that could not be validated."""
+    return ValidationResult(
+        file_path=path,
+        errors=[ValidationError(code="E000", message=message, severity=Severity.ERROR)],
+    )
+
+
+def _validate_or_crash(path: str, metadata: Optional[dict]) -> ValidationResult:
+    """validate_file(), reporting an unexpected exception as E000 for that file."""
+    try:
+        return validate_file(path, metadata)
+    except Exception as e:
+        logger.error("Validation crash for %s: %s", path, e)
+        return _crash_result(path, f"Crash: {e}")
+
+
+def _metadata_mb(metadata: dict) -> float:
+    """Estimated pickled size of the metadata in MB, from its method count."""
+    methods = 0
+    for cls_meta in metadata.values():
+        if isinstance(cls_meta, dict):
+            methods += len(cls_meta.get("methods") or ())
+    return methods * _PICKLED_BYTES_PER_METHOD / (1024 * 1024)
+
+
+def use_worker_pool(file_count: int, jobs: int, metadata: Optional[dict] = None,
+                    start_method: Optional[str] = None) -> bool:
+    """Decide whether a batch is large enough to pay for worker processes."""
+    start_method = start_method or multiprocessing.get_start_method()
+    # A spawned worker starts a fresh interpreter and re-imports the package
+    min_files = PARALLEL_MIN_FILES if start_method == "fork" else PARALLEL_MIN_FILES_SPAWN
+    if jobs <= 1 or file_count < min_files:
+        return False
+    # Without fork, every worker receives its own pickled copy of the metadata
+    if metadata and start_method != "fork":
+        size_mb = _metadata_mb(metadata)
+        if size_mb > WORKER_METADATA_MB:
+            logger.info("Metadata is ~%.0f MB pickled; validating sequentially", size_mb)
+            return False
+    return True
+
+
+def validate_files(paths: List[str], metadata: Optional[dict] = None,
+                   jobs: Optional[int] = None,
+                   mp_context=None) -> Iterator[ValidationResult]:
+    """
+    Validate several files, yielding results in input order.
+
+    Args:
+        paths: XML files to validate
+        metadata: Optional dict of class->methods metadata for semantic validation
+        jobs: Worker processes (default: CPU count, 1 = sequential)
+        mp_context: multiprocessing context for the workers; callers with
+            their own threads (the GUI) should pass a "spawn" context
+            rather than fork a multi-threaded process
+
+    Yields:
+        One ValidationResult per path; a file that raises, or whose worker
+        process dies, is reported as E000
+    """
+    jobs = jobs or os.cpu_count() or 1
+    start_method = mp_context.get_start_method() if mp_context else None
+    if not use_worker_pool(len(paths), jobs, metadata, start_method):
+        for path in paths:
+            yield _validate_or_crash(path, metadata)
+        return
+
+    executor = None
+    try:
+        executor = ProcessPoolExecutor(
+            max_workers=min(jobs, len(paths)), mp_context=mp_context,
+            initializer=_init_worker, initargs=(metadata,),
+        )
+        futures = [executor.submit(_validate_in_worker, path) for path in paths]
+    except (OSError, BrokenProcessPool) as e:
+        if executor is not None:
+            executor.shutdown(wait=False)
+        logger.warning("Could not start worker processes (%s); validating sequentially", e)
+        for path in paths:
+            yield _validate_or_crash(path, metadata)
+        return
+
+    with executor:
+        for path, future in zip(paths, futures):
+            try:
+                yield future.result()
+            except BrokenProcessPool as e:
+                # A worker was killed (OOM, segfault); its files and any
+                # still queued cannot be finished by this pool
+                logger.error("Worker process died before %s was validated: %s", path, e)
+                yield _crash_result(path, "Crash: validation worker process terminated")
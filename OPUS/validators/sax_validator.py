@@ -5,11 +5,13 @@ Main validation engine using Python's xml.sax for streaming parse
 with structural, hierarchy, attribute, and metadata validation.
 """
 
+import io
 import os
 import re
 import logging
 import difflib
 import time
+import threading
 import xml.sax
 from xml.sax.handler import ContentHandler
 from typing import List, Optional, Dict, Set, Tuple
@@ -24,6 +26,10 @@ from .preflight import preflight_scan
 
 logger = logging.getLogger(__name__)
 
+# One SAX reader per thread, reused across documents
+_parser_local = threading.local()
+_NO_HANDLER = ContentHandler()
+
 
 class HybridValidator(ContentHandler):
     """
@@ -228,9 +234,9 @@ class HybridValidator(ContentHandler):
                     self.method_names[mname] = line
 
                 if self.metadata and self.current_class and self.current_class in self.metadata:
+                    # Extracted metadata maps method name -> info, so this
+                    # is a dict lookup; list-form metadata is scanned
                     valid = self.metadata[self.current_class].get("methods", [])
-                    if isinstance(valid, dict):
-                        valid = list(valid.keys())
                     if mname not in valid:
                         sugg = self._get_suggestion(mname, valid)
                         self._err("E301", f"Method not in {self.current_class}: {mname}", line, col, mname, sugg)
@@ -374,6 +380,14 @@ class HybridValidator(ContentHandler):
             self._err("E105", "Missing <suite>", 0, 0)
 
 
+def _get_parser():
+    """Return this thread's SAX reader; parse() resets it for every document."""
+    parser = getattr(_parser_local, "parser", None)
+    if parser is None:
+        parser = _parser_local.parser = xml.sax.make_parser()
+    return parser
+
+
 def _read_file_lines(path: str) -> List[str]:
     """Read file lines with encoding fallback."""
     for enc in ENCODING_FALLBACKS:
@@ -417,6 +431,35 @@ def validate_file(path: str, metadata: dict = None) -> ValidationResult:
     # 1. Read file lines (for context injection and pre-flight)
     lines = _read_file_lines(path)
 
+    return _validate(path, path, lines, metadata, file_size, start_time)
+
+
+def validate_string(xml_text: str, metadata: dict = None,
+                    file_path: str = "<string>") -> ValidationResult:
+    """
+    Validate TestNG XML held in memory, without a temporary file.
+
+    Runs the same checks as validate_file().
+
+    Args:
+        xml_text: XML document text
+        metadata: Optional dict of class->methods metadata for semantic validation
+        file_path: Name reported in the result (default: "<string>")
+
+    Returns:
+        ValidationResult with all findings
+    """
+    start_time = time.time()
+    # Split like a file read (\n, \r, \r\n only); str.splitlines() also
+    # breaks on U+2028, \x0c etc., which expat does not count as lines
+    lines = io.StringIO(xml_text, newline="").readlines()
+    return _validate(file_path, io.StringIO(xml_text), lines, metadata,
+                     len(xml_text.encode("utf-8")), start_time)
+
+
+def _validate(path: str, source, lines: List[str], metadata: Optional[dict],
+              file_size: int, start_time: float) -> ValidationResult:
+    """Steps 2-5 of validate_file(); source is a path or text stream for SAX."""
     # 2. Pre-flight scan
     pre_errors = preflight_scan(path, lines)
 
@@ -424,10 +467,10 @@ def validate_file(path: str, metadata: dict = None) -> ValidationResult:
     validator = HybridValidator(path, metadata)
     validator.errors.extend(pre_errors)
 
+    parser = _get_parser()
     try:
-        parser = xml.sax.make_parser()
         parser.setContentHandler(validator)
-        parser.parse(path)
+        parser.parse(source)
     except xml.sax.SAXParseException as e:
         custom_msg = f"Syntax Error: {e.getMessage()}"
         # Try to provide a more helpful message for mismatched tags
@@ -456,6 +499,9 @@ def validate_file(path: str, metadata: dict = None) -> ValidationResult:
             code="E000", message=f"Parser crash: {str(e)}",
             line=0, col=0, severity=Severity.ERROR,
         ))
+    finally:
+        # Don't keep the last document's handler (and metadata) alive
+        parser.setContentHandler(_NO_HANDLER)
 
     # 4. Context injection — attach source line content to each error
     for err in validator.errors: